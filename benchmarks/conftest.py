@@ -0,0 +1,39 @@
+"""Fixtures for the CC Player benchmarks."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def loop():
+    """Event loop driving the fake hass."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+    asyncio.set_event_loop(None)
+
+
+@pytest.fixture
+def hass(loop):
+    """Fake hass with the MQTT stub installed."""
+    from fakes import FakeHass, StubMqtt
+
+    stub = StubMqtt()
+    restore = stub.install()
+    hass = FakeHass(loop)
+    hass.mqtt_stub = stub
+    yield hass
+    hass.block_till_done()
+    restore()
+
+
+@pytest.fixture
+def player(hass):
+    """Player linked to a full set of entities, primed like after setup."""
+    from fakes import make_player
+
+    player = make_player(hass)
+    player._refresh_states()
+    return player
@@ -0,0 +1,403 @@
+"""Lightweight stand-ins for Home Assistant and MQTT used by the benchmarks.
+
+Only what CCPlayerMediaPlayer touches is implemented, so the hot paths can
+be timed without booting Home Assistant or connecting to a broker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import itertools
+import json
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from homeassistant.components import mqtt  # noqa: E402
+from homeassistant.core import State  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+
+from custom_components.ccplayer.const import DOMAIN  # noqa: E402
+from custom_components.ccplayer import media_player  # noqa: E402
+from custom_components.ccplayer.hub import CCPlayerHub  # noqa: E402
+from custom_components.ccplayer.media_player import (  # noqa: E402
+    CCPlayerMediaPlayer,
+)
+
+DEVICE_ID = "YANClient-40074106"
+QUEUE_SIZES = (10, 1_000, 10_000)
+REGISTRY_SIZES = (1_000, 10_000, 50_000)
+
+# Entities each synthetic YAN device registers, as (domain, object id suffix)
+YAN_DEVICE_ENTITIES = (
+    ("switch", "power"),
+    ("sensor", "playback_state"),
+    ("sensor", "media_title"),
+    ("image", "media_thumbnail"),
+    ("sensor", "media_position"),
+    ("sensor", "media_duration"),
+    ("switch", "mute"),
+    ("number", "volume"),
+    ("button", "play"),
+    ("button", "pause"),
+)
+
+
+class FakeStates:
+    """State machine holding State objects by entity id.
+
+    Setting a state fires a state_changed style event to the listeners
+    registered through patch_state_tracking.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[str, State] = {}
+        self._listeners: dict[str, list[Callable[[Any], None]]] = {}
+        self.events_fired = 0
+
+    def get(self, entity_id: str) -> State | None:
+        return self._states.get(entity_id)
+
+    def async_set(
+        self, entity_id: str, state: str, attributes: dict[str, Any] | None = None
+    ) -> State:
+        old_state = self._states.get(entity_id)
+        new_state = State(entity_id, state, attributes or {})
+        self._states[entity_id] = new_state
+
+        if listeners := self._listeners.get(entity_id):
+            event = SimpleNamespace(
+                data={
+                    "entity_id": entity_id,
+                    "old_state": old_state,
+                    "new_state": new_state,
+                }
+            )
+            for listener in tuple(listeners):
+                self.events_fired += 1
+                listener(event)
+        return new_state
+
+    def async_track(
+        self, entity_ids: list[str], action: Callable[[Any], None]
+    ) -> Callable[[], None]:
+        """Call action on state changes of the entities, like the event helper."""
+        for entity_id in entity_ids:
+            self._listeners.setdefault(entity_id, []).append(action)
+
+        def unsubscribe() -> None:
+            for entity_id in entity_ids:
+                self._listeners[entity_id].remove(action)
+
+        return unsubscribe
+
+
+class FakeServices:
+    """Service registry that only counts the calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def async_call(self, domain: str, service: str, *args: Any, **kwargs: Any):
+        self.calls += 1
+
+
+class FakeConfig:
+    """Config with URLs and a throwaway config dir."""
+
+    external_url = None
+    internal_url = "http://homeassistant.local:8123"
+
+    def __init__(self) -> None:
+        self.config_dir = tempfile.mkdtemp(prefix="ccplayer-bench-")
+
+    def path(self, *parts: str) -> str:
+        return os.path.join(self.config_dir, *parts)
+
+
+class FakeHass:
+    """The parts of HomeAssistant the player and the hub use."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.data: dict[str, Any] = {}
+        self.states = FakeStates()
+        self.services = FakeServices()
+        self.config = FakeConfig()
+        self._tasks: set[asyncio.Task] = set()
+
+    def async_create_task(self, coro, name: str | None = None, eager_start: bool = True):
+        task = self.loop.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def async_add_executor_job(self, target: Callable[..., Any], *args: Any):
+        return await self.loop.run_in_executor(None, target, *args)
+
+    def verify_event_loop_thread(self, what: str) -> None:
+        """Benchmarks run everything in the loop thread."""
+
+    async def async_block_till_done(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def block_till_done(self) -> None:
+        self.loop.run_until_complete(self.async_block_till_done())
+
+
+def _topic_matches(topic_filter: str, topic: str) -> bool:
+    """Match an MQTT topic against a filter with + and # wildcards."""
+    filter_parts = topic_filter.split("/")
+    topic_parts = topic.split("/")
+    for index, part in enumerate(filter_parts):
+        if part == "#":
+            return True
+        if index >= len(topic_parts) or part not in ("+", topic_parts[index]):
+            return False
+    return len(filter_parts) == len(topic_parts)
+
+
+class StubMqtt:
+    """In-process broker stand-in replacing mqtt.async_subscribe/async_publish."""
+
+    def __init__(self) -> None:
+        self._subscriptions: list[tuple[str, Callable[[Any], None]]] = []
+        self.published: list[tuple[str, Any]] = []
+        self.delivered = 0
+
+    async def async_subscribe(
+        self, hass: Any, topic: str, msg_callback: Callable[[Any], None], *args, **kwargs
+    ) -> Callable[[], None]:
+        subscription = (topic, msg_callback)
+        self._subscriptions.append(subscription)
+
+        def unsubscribe() -> None:
+            self._subscriptions.remove(subscription)
+
+        return unsubscribe
+
+    async def async_publish(self, hass: Any, topic: str, payload: Any, *args, **kwargs):
+        self.published.append((topic, payload))
+
+    def deliver(self, topic: str, payload: str) -> None:
+        """Deliver a message to the matching subscribers, like the broker would."""
+        msg = SimpleNamespace(topic=topic, payload=payload, qos=1, retain=False)
+        for topic_filter, msg_callback in tuple(self._subscriptions):
+            if _topic_matches(topic_filter, topic):
+                self.delivered += 1
+                msg_callback(msg)
+
+    def install(self) -> Callable[[], None]:
+        """Patch the mqtt component and return a function undoing it."""
+        originals = (mqtt.async_subscribe, mqtt.async_publish)
+        mqtt.async_subscribe = self.async_subscribe
+        mqtt.async_publish = self.async_publish
+
+        def restore() -> None:
+            mqtt.async_subscribe, mqtt.async_publish = originals
+
+        return restore
+
+
+def patch_state_tracking() -> Callable[[], None]:
+    """Route the player's state change subscription to the fake state machine."""
+    original = media_player.async_track_state_change_event
+
+    def track(hass: FakeHass, entity_ids: Any, action: Callable[[Any], None]):
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        return hass.states.async_track(list(entity_ids), action)
+
+    media_player.async_track_state_change_event = track
+
+    def restore() -> None:
+        media_player.async_track_state_change_event = original
+
+    return restore
+
+
+class FakeEntityRegistry:
+    """Entity registry holding entries by entity id, indexed by device."""
+
+    def __init__(self) -> None:
+        self.entities: dict[str, SimpleNamespace] = {}
+        self._by_device: dict[str, list[SimpleNamespace]] = {}
+
+    def add(self, entity_id: str, device_id: str | None) -> None:
+        entry = SimpleNamespace(entity_id=entity_id, device_id=device_id)
+        self.entities[entity_id] = entry
+        if device_id:
+            self._by_device.setdefault(device_id, []).append(entry)
+
+    def entries_for_device(self, device_id: str) -> list[SimpleNamespace]:
+        return list(self._by_device.get(device_id, ()))
+
+    def install(self) -> Callable[[], None]:
+        """Patch the entity registry helpers and return a function undoing it."""
+        originals = (er.async_get, er.async_entries_for_device)
+        er.async_get = lambda hass: self
+        er.async_entries_for_device = (
+            lambda registry, device_id, *args, **kwargs: registry.entries_for_device(
+                device_id
+            )
+        )
+
+        def restore() -> None:
+            er.async_get, er.async_entries_for_device = originals
+
+        return restore
+
+
+def registry_device_id(index: int) -> str:
+    """Return the registry device id of the nth synthetic YAN device."""
+    return f"device{index}"
+
+
+def make_entity_registry(size: int) -> FakeEntityRegistry:
+    """Return a registry of about size entities from synthetic YAN devices.
+
+    Entities are linked to their device, except one in ten, like entities
+    of integrations without device support.
+    """
+    registry = FakeEntityRegistry()
+    for index in range(size // len(YAN_DEVICE_ENTITIES)):
+        fragment = entity_fragment(index)
+        for position, (domain, suffix) in enumerate(YAN_DEVICE_ENTITIES):
+            linked = (index + position) % 10 != 0
+            registry.add(
+                f"{domain}.{fragment}_{suffix}",
+                registry_device_id(index) if linked else None,
+            )
+    return registry
+
+
+_entry_ids = itertools.count()
+
+
+def entity_fragment(index: int) -> str:
+    """Return the entity id fragment of the nth benchmark player."""
+    return f"yan_yanclient_{index}"
+
+
+def player_options(fragment: str, **overrides: Any) -> dict[str, Any]:
+    """Return options linking every role to an entity and a few actions."""
+    return {
+        "power_entity": f"switch.{fragment}_power",
+        "player_state_entity": f"sensor.{fragment}_playback_state",
+        "volume_entity": f"number.{fragment}_volume",
+        "mute_entity": f"switch.{fragment}_mute",
+        "source_entity": f"select.{fragment}_source",
+        "source_list_entity": f"sensor.{fragment}_source_list",
+        "media_title_entity": f"sensor.{fragment}_media_title",
+        "media_artist_entity": f"sensor.{fragment}_media_artist",
+        "media_album_entity": f"sensor.{fragment}_media_album",
+        "media_image_entity": f"image.{fragment}_media_thumbnail",
+        "media_position_entity": f"sensor.{fragment}_media_position",
+        "media_duration_entity": f"sensor.{fragment}_media_duration",
+        "actions": {
+            "play_action": [
+                {
+                    "action": "button.press",
+                    "data": {},
+                    "target": {"entity_id": f"button.{fragment}_play"},
+                }
+            ],
+            "seek_action": [
+                {
+                    "action": "number.set_value",
+                    "data": {"value": "{{ seek_position }}"},
+                    "target": {"entity_id": f"number.{fragment}_media_seek"},
+                }
+            ],
+        },
+        **overrides,
+    }
+
+
+def seed_states(hass: FakeHass, fragment: str) -> None:
+    """Give every linked entity of a player a realistic state."""
+    states = hass.states
+    states.async_set(f"switch.{fragment}_power", "on")
+    states.async_set(f"sensor.{fragment}_playback_state", "playing")
+    states.async_set(f"number.{fragment}_volume", "40", {"min": 0, "max": 100})
+    states.async_set(f"switch.{fragment}_mute", "off")
+    states.async_set(f"select.{fragment}_source", "HDMI 1")
+    states.async_set(f"sensor.{fragment}_source_list", '["HDMI 1", "HDMI 2", "Cast"]')
+    states.async_set(f"sensor.{fragment}_media_title", "Big Buck Bunny")
+    states.async_set(f"sensor.{fragment}_media_artist", "Blender Foundation")
+    states.async_set(f"sensor.{fragment}_media_album", "Open Movies")
+    states.async_set(
+        f"image.{fragment}_media_thumbnail",
+        "2024-01-01T00:00:00+00:00",
+        {"entity_picture": f"/api/image_proxy/image.{fragment}_media_thumbnail"},
+    )
+    states.async_set(f"sensor.{fragment}_media_position", "120000")
+    states.async_set(f"sensor.{fragment}_media_duration", "596000")
+
+
+def make_player(
+    hass: FakeHass, index: int = 0, device_id: str = DEVICE_ID, **overrides: Any
+) -> CCPlayerMediaPlayer:
+    """Create a player wired to the fake hass, with state writes counted."""
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = CCPlayerHub(hass)
+
+    fragment = entity_fragment(index)
+    seed_states(hass, fragment)
+    entry = SimpleNamespace(
+        entry_id=f"bench{next(_entry_ids)}",
+        data={"name": f"Player {index}", "device_id": device_id},
+        options=player_options(fragment, **overrides),
+        add_update_listener=lambda listener: lambda: None,
+    )
+    player = CCPlayerMediaPlayer(hass, entry, f"Player {index}")
+    player.entity_id = f"media_player.{fragment}"
+    player.state_writes = 0
+
+    def count_write() -> None:
+        player.state_writes += 1
+
+    player.async_write_ha_state = count_write
+    hass.data[DOMAIN].players[entry.entry_id] = player
+    return player
+
+
+def queue_payload(size: int, seq: int = 1) -> str:
+    """Return a media_queue snapshot payload with size items."""
+    return json.dumps(
+        {
+            "seq": seq,
+            "playlist": [
+                {
+                    "index": index,
+                    "mediaId": f"media-{index}",
+                    "title": f"Episode {index}",
+                    "thumbnail": f"http://192.168.1.50:8080/thumbs/{index}.jpg",
+                }
+                for index in range(size)
+            ],
+        }
+    )
+
+
+def playlists_payload(size: int) -> str:
+    """Return a playlists/available payload with size playlists."""
+    return json.dumps(
+        {
+            "playlists": [
+                {
+                    "index": index,
+                    "title": f"Playlist {index}.json",
+                    "description": "Weekly rotation",
+                    "thumbnail": f"http://192.168.1.50:8080/playlists/{index}.jpg",
+                }
+                for index in range(size)
+            ]
+        }
+    )
@@ -0,0 +1,304 @@
+"""Fleet-scale soak test replaying YAN MQTT and linked entity traffic.
+
+Spins up N CCPlayerMediaPlayer entities on the fake hass from fakes.py,
+with the in-process MQTT stub standing in for the broker, and replays a
+trace at a fixed total event rate. Reports the achieved events/s, state
+writes/s, event loop lag p50/p99 and memory growth, to show where one
+Home Assistant instance running ccplayer saturates. Runs fully offline.
+
+Usage, from the repository root:
+
+    python benchmarks/soak.py --players 500 --rate 5000 --duration 60
+    python benchmarks/soak.py --write-trace trace.jsonl
+    python benchmarks/soak.py --trace trace.jsonl --state-from-mqtt
+
+Trace lines are either JSON objects or `mosquitto_sub -v` output:
+
+    {"status": "media_position", "payload": "{\"value\": 12000}"}
+    {"entity": "sensor.{fragment}_media_title", "state": "Intro"}
+    yan/YANClient-1/status/media_position {"value": 12000}
+
+Status lines are published on yan/<device>/status/<subtopic> of each
+player's device, entity lines set the state of each player's linked
+entity, with {fragment} replaced by its entity id fragment. Each player
+walks the trace in order, the players take turns, and the pacing comes
+from --rate rather than from timestamps in the trace.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import os
+import random
+import sys
+import tracemalloc
+from typing import Any
+
+from fakes import (
+    FakeHass,
+    StubMqtt,
+    entity_fragment,
+    make_player,
+    patch_state_tracking,
+)
+
+# Pacing granularity of the replay and the loop lag probe, in seconds
+TICK = 0.01
+
+
+def yan_device_id(index: int) -> str:
+    """Return the YAN device id of the nth player."""
+    return f"YANClient-{index}"
+
+
+def load_trace(path: str) -> list[dict[str, Any]]:
+    """Read a JSONL or mosquitto_sub -v trace."""
+    events = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+            if line.lstrip().startswith("{"):
+                events.append(json.loads(line))
+                continue
+            topic, _, payload = line.partition(" ")
+            parts = topic.split("/", 3)
+            if len(parts) == 4 and parts[0] == "yan" and parts[2] == "status":
+                events.append({"status": parts[3], "payload": payload})
+    if not events:
+        raise SystemExit(f"No replayable events in {path}")
+    return events
+
+
+def synthetic_trace(seconds: int = 600, seed: int = 1) -> list[dict[str, Any]]:
+    """Return typical YAN traffic for one device, one position tick a second."""
+    rng = random.Random(seed)
+    events: list[dict[str, Any]] = []
+    position = 0
+    duration = 596_000
+    playing = True
+    for second in range(seconds):
+        if second % 120 == 0:
+            title = f"Episode {second // 120}"
+            position = 0
+            events += [
+                {"status": "media_title", "payload": json.dumps({"value": title})},
+                {"entity": "sensor.{fragment}_media_title", "state": title},
+                {"status": "media_duration", "payload": json.dumps({"value": duration})},
+                {"entity": "sensor.{fragment}_media_duration", "state": str(duration)},
+            ]
+        if second % 90 == 45:
+            playing = not playing
+            state = "playing" if playing else "paused"
+            events += [
+                {"status": "playback_state", "payload": json.dumps({"value": state})},
+                {"entity": "sensor.{fragment}_playback_state", "state": state},
+            ]
+        if rng.random() < 0.05:
+            volume = rng.randint(0, 100)
+            events += [
+                {"status": "volume", "payload": json.dumps({"value": volume})},
+                {
+                    "entity": "number.{fragment}_volume",
+                    "state": str(volume),
+                    "attributes": {"min": 0, "max": 100},
+                },
+            ]
+        if playing:
+            position += 1000
+        events += [
+            {"status": "media_position", "payload": json.dumps({"value": position})},
+            {"entity": "sensor.{fragment}_media_position", "state": str(position)},
+        ]
+    return events
+
+
+def rss_bytes() -> int | None:
+    """Return the resident set size of this process, if the OS reports it."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def heap_bytes() -> int | None:
+    """Return the Python heap in use, if tracemalloc is tracing."""
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return a percentile of the samples, 0 if there are none."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure_loop_lag(samples: list[float]) -> None:
+    """Record how late the loop wakes up a sleeper, until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(TICK)
+        samples.append(loop.time() - start - TICK)
+
+
+async def run_soak(
+    players_count: int,
+    trace: list[dict[str, Any]],
+    rate: float,
+    duration: float,
+    player_options: dict[str, Any],
+) -> dict[str, Any]:
+    """Replay the trace against a fleet of players and return the report."""
+    loop = asyncio.get_running_loop()
+    hass = FakeHass(loop)
+    broker = StubMqtt()
+    restores = [broker.install(), patch_state_tracking()]
+    try:
+        players = [
+            make_player(hass, index, yan_device_id(index), **player_options)
+            for index in range(players_count)
+        ]
+        for player in players:
+            player._setup_listeners()
+            player._refresh_states()
+            await player._async_subscribe_mqtt()
+
+        gc.collect()
+        rss_start = rss_bytes()
+        heap_start = heap_bytes()
+        writes_start = sum(player.state_writes for player in players)
+
+        lag_samples: list[float] = []
+        lag_probe = asyncio.create_task(measure_loop_lag(lag_samples))
+
+        cursors = [0] * players_count
+        turn = itertools.cycle(range(players_count))
+        dispatched = 0
+        budget = 0.0
+        start = deadline = loop.time()
+        while loop.time() - start < duration:
+            budget += rate * TICK
+            while budget >= 1:
+                index = next(turn)
+                event = trace[cursors[index]]
+                cursors[index] = (cursors[index] + 1) % len(trace)
+                if "status" in event:
+                    broker.deliver(
+                        f"yan/{yan_device_id(index)}/status/{event['status']}",
+                        event["payload"],
+                    )
+                else:
+                    hass.states.async_set(
+                        event["entity"].format(fragment=entity_fragment(index)),
+                        event["state"],
+                        event.get("attributes"),
+                    )
+                dispatched += 1
+                budget -= 1
+            deadline += TICK
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+        await hass.async_block_till_done()
+        elapsed = loop.time() - start
+        lag_probe.cancel()
+
+        gc.collect()
+        rss_end = rss_bytes()
+        heap_end = heap_bytes()
+        writes = sum(player.state_writes for player in players) - writes_start
+
+        return {
+            "players": players_count,
+            "duration_s": round(elapsed, 2),
+            "target_events_per_s": rate,
+            "events_per_s": round(dispatched / elapsed, 1),
+            "mqtt_messages": broker.delivered,
+            "state_change_events": hass.states.events_fired,
+            "state_writes_per_s": round(writes / elapsed, 1),
+            "writes_per_event": round(writes / dispatched, 3) if dispatched else 0.0,
+            "loop_lag_p50_ms": round(percentile(lag_samples, 0.50) * 1000, 2),
+            "loop_lag_p99_ms": round(percentile(lag_samples, 0.99) * 1000, 2),
+            "loop_lag_max_ms": round(max(lag_samples, default=0.0) * 1000, 2),
+            "rss_growth_bytes": (
+                rss_end - rss_start
+                if rss_start is not None and rss_end is not None
+                else None
+            ),
+            "heap_growth_bytes": (
+                heap_end - heap_start if heap_start is not None else None
+            ),
+        }
+    finally:
+        for restore in restores:
+            restore()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments, run the soak test and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--players", type=int, default=100, help="players to run")
+    parser.add_argument(
+        "--rate", type=float, default=1000.0, help="events per second, all players"
+    )
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--trace", help="JSONL or mosquitto_sub -v trace to replay")
+    parser.add_argument(
+        "--write-trace", metavar="PATH", help="write the synthetic trace and exit"
+    )
+    parser.add_argument(
+        "--state-from-mqtt",
+        action="store_true",
+        help="ingest player state from the status topics instead of entities",
+    )
+    parser.add_argument(
+        "--position-extrapolation",
+        action="store_true",
+        help="enable position extrapolation on every player",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="also report Python heap growth, slows the run down",
+    )
+    parser.add_argument("--json", metavar="PATH", help="also write the report here")
+    args = parser.parse_args(argv)
+
+    if args.write_trace:
+        with open(args.write_trace, "w", encoding="utf-8") as file:
+            for event in synthetic_trace():
+                file.write(json.dumps(event) + "\n")
+        return
+
+    trace = load_trace(args.trace) if args.trace else synthetic_trace()
+    player_options = {
+        "state_from_mqtt": args.state_from_mqtt,
+        "position_extrapolation": args.position_extrapolation,
+    }
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    report = asyncio.run(
+        run_soak(args.players, trace, args.rate, args.duration, player_options)
+    )
+
+    width = max(len(key) for key in report)
+    for key, value in report.items():
+        print(f"{key:<{width}}  {value}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if report["events_per_s"] < 0.95 * args.rate:
+        print("Loop saturated: achieved rate is below the target", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmarks of the config flow's entity discovery on large registries."""
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_benchmark")
+
+from fakes import (  # noqa: E402
+    REGISTRY_SIZES,
+    YAN_DEVICE_ENTITIES,
+    make_entity_registry,
+    registry_device_id,
+)
+
+from custom_components.ccplayer.discovery import (  # noqa: E402
+    EntityIndex,
+    async_build_entry_options,
+)
+
+
+@pytest.fixture(params=REGISTRY_SIZES, ids=lambda size: f"{size}_entities")
+def registry(request, hass):
+    """Synthetic entity registry installed on the fake hass."""
+    registry = make_entity_registry(request.param)
+    restore = registry.install()
+    yield registry
+    restore()
+
+
+def _middle_device(registry) -> int:
+    return len(registry.entities) // len(YAN_DEVICE_ENTITIES) // 2
+
+
+def test_build_entry_options_linked(benchmark, hass, registry):
+    """Option auto-mapping of a device linked in the registry, as in the flow."""
+    index = _middle_device(registry)
+    options = benchmark(
+        async_build_entry_options,
+        hass,
+        f"YANClient-{index}",
+        registry_device_id(index),
+    )
+    assert options["volume_entity"]
+
+
+def test_build_entry_options_unlinked(benchmark, hass, registry):
+    """Option auto-mapping without a linked device, indexing the registry."""
+    index = _middle_device(registry)
+    options = benchmark(
+        async_build_entry_options, hass, f"YANClient-{index}", None
+    )
+    assert options["volume_entity"]
+
+
+def test_entity_index_find(benchmark, hass, registry):
+    """A lookup on a built index, falling back past the device's entities."""
+    index = _middle_device(registry)
+    entity_index = EntityIndex(
+        hass, f"yan_yanclient_{index}", registry_device_id(index)
+    )
+    benchmark(entity_index.find, "switch", f"yan_yanclient_{index}_missing")
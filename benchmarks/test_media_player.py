@@ -0,0 +1,135 @@
+"""Benchmarks of the CCPlayerMediaPlayer hot paths."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_benchmark")
+
+from fakes import DEVICE_ID, QUEUE_SIZES, playlists_payload, queue_payload  # noqa: E402
+
+from custom_components.ccplayer.browse_media import (  # noqa: E402
+    PLAYLISTS_NODE_ID,
+    SOURCES_NODE_ID,
+    page_node_id,
+)
+
+
+def _message(subtopic: str, payload: str) -> SimpleNamespace:
+    topic = f"yan/{DEVICE_ID}/status/{subtopic}"
+    return SimpleNamespace(topic=topic, payload=payload, qos=1, retain=False)
+
+
+def _load_queue(hass, player, size: int) -> None:
+    msg = _message("media_queue", queue_payload(size))
+    player._handle_status_message("media_queue", msg)
+    hass.block_till_done()
+
+
+def _browse(loop, player, node_id: str):
+    return loop.run_until_complete(player.async_browse_media("directory", node_id))
+
+
+def test_refresh_states(benchmark, player):
+    """Full re-read of every linked entity, as on setup and config changes."""
+    benchmark(player._refresh_states)
+
+
+def test_determine_player_state(benchmark, player):
+    """Player state derivation from the state and power entities."""
+    assert benchmark(player._determine_player_state) is not None
+
+
+def test_call_action_list_static(benchmark, loop, player):
+    """Dispatch of an action without templates."""
+    benchmark(lambda: loop.run_until_complete(player._call_action_list("play_action")))
+
+
+def test_call_action_list_templated(benchmark, loop, player):
+    """Dispatch of an action rendering a template per call."""
+    benchmark(
+        lambda: loop.run_until_complete(
+            player._call_action_list("seek_action", {"seek_position": 42})
+        )
+    )
+
+
+@pytest.mark.parametrize("size", QUEUE_SIZES)
+def test_handle_mediaqueue_message(benchmark, hass, player, size):
+    """Ingest a new media queue snapshot, including an off-loop decode."""
+    msg = _message("media_queue", queue_payload(size))
+
+    def setup():
+        # Forget the last payload so every round parses it again
+        player._browse_hashes.pop(SOURCES_NODE_ID, None)
+        player._mediaqueue_seq = None
+
+    def ingest():
+        player._handle_status_message("media_queue", msg)
+        hass.block_till_done()
+
+    benchmark.pedantic(ingest, setup=setup, rounds=20)
+    assert len(player._mediaqueue) == size
+
+
+@pytest.mark.parametrize("size", QUEUE_SIZES)
+def test_handle_mediaqueue_message_unchanged(benchmark, hass, player, size):
+    """Republished identical queue, skipped by its content hash."""
+    msg = _message("media_queue", queue_payload(size))
+    player._handle_status_message("media_queue", msg)
+    hass.block_till_done()
+
+    benchmark(player._handle_status_message, "media_queue", msg)
+
+
+@pytest.mark.parametrize("size", QUEUE_SIZES)
+def test_handle_playlists_message(benchmark, hass, player, size):
+    """Ingest a new playlists payload."""
+    msg = _message("playlists/available", playlists_payload(size))
+
+    def setup():
+        player._browse_hashes.pop(PLAYLISTS_NODE_ID, None)
+
+    def ingest():
+        player._handle_status_message("playlists/available", msg)
+        hass.block_till_done()
+
+    benchmark.pedantic(ingest, setup=setup, rounds=20)
+    assert len(player._playlists.playlists) == size
+
+
+@pytest.mark.parametrize("size", QUEUE_SIZES)
+def test_browse_sources_cold(benchmark, loop, hass, player, size):
+    """First browse of the Sources directory after the queue changed."""
+    _load_queue(hass, player, size)
+
+    def browse():
+        player._invalidate_browse_nodes(SOURCES_NODE_ID)
+        return _browse(loop, player, SOURCES_NODE_ID)
+
+    assert benchmark(browse).children
+
+
+@pytest.mark.parametrize("size", QUEUE_SIZES)
+def test_browse_sources_page_cold(benchmark, loop, hass, player, size):
+    """First browse of the last page of the Sources directory."""
+    _load_queue(hass, player, size)
+    root = _browse(loop, player, SOURCES_NODE_ID)
+    node_id = root.children[-1].media_content_id if size > 100 else SOURCES_NODE_ID
+
+    def browse():
+        player._invalidate_browse_nodes(SOURCES_NODE_ID)
+        return _browse(loop, player, node_id)
+
+    assert benchmark(browse).children
+
+
+@pytest.mark.parametrize("size", QUEUE_SIZES)
+def test_browse_sources_warm(benchmark, loop, hass, player, size):
+    """Repeated browse of the same page, served from the memoized node."""
+    _load_queue(hass, player, size)
+    node_id = page_node_id(SOURCES_NODE_ID, 1) if size > 100 else SOURCES_NODE_ID
+    _browse(loop, player, node_id)
+
+    assert benchmark(_browse, loop, player, node_id).children
@@ -2,16 +2,25 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
+from .hub import CCPlayerHub
 
-PLATFORMS = ["media_player"]
+PLATFORMS = ["media_player", "sensor"]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up CC Player from a config entry."""
+    # One hub, and one MQTT subscription, shared by every player
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = CCPlayerHub(hass)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hub: CCPlayerHub = hass.data[DOMAIN]
+        hub.players.pop(entry.entry_id, None)
+        hub.counters.pop(entry.entry_id, None)
+    return unload_ok
@@ -0,0 +1,182 @@
+"""Precompiled action plans for CC Player."""
+
+from dataclasses import dataclass
+import logging
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.template import Template, is_template_string, render_complex
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shape of a single action as stored by the action selector. Only the keys
+# the plan compiler reads are checked, anything else (metadata, alias, ...)
+# is carried along untouched.
+ACTION_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive("action", "service name"): cv.string,
+            vol.Exclusive("service", "service name"): cv.string,
+            # Legacy templated service name, still accepted by HA scripts
+            vol.Exclusive("service_template", "service name"): cv.string,
+            vol.Optional("data"): dict,
+            vol.Optional("data_template"): dict,
+            vol.Optional("target"): dict,
+            vol.Optional(ATTR_ENTITY_ID): vol.Any(cv.string, [cv.string]),
+        },
+        extra=vol.ALLOW_EXTRA,
+    ),
+    cv.has_at_least_one_key("action", "service", "service_template"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ActionPlan:
+    """A service call compiled once from an action config.
+
+    Static payload parts are frozen at compile time; only the templated
+    parts are rendered on each call.
+    """
+
+    config: Mapping[str, Any]
+    service: str | Template
+    static_data: Mapping[str, Any]
+    template_data: Mapping[str, Any]
+    static_target: Mapping[str, Any]
+    template_target: Mapping[str, Any]
+
+    def render(
+        self, variables: Mapping[str, Any]
+    ) -> tuple[str, str, dict[str, Any], dict[str, Any] | None]:
+        """Render the variable parts and return domain, service, data and target."""
+        if isinstance(self.service, Template):
+            service_name = self.service.async_render(variables, parse_result=False)
+        else:
+            service_name = self.service
+        domain, service = service_name.split(".", 1)
+
+        data = dict(self.static_data)
+        if self.template_data:
+            data.update(render_complex(dict(self.template_data), variables))
+
+        target = None
+        if self.static_target or self.template_target:
+            target = dict(self.static_target)
+            if self.template_target:
+                target.update(render_complex(dict(self.template_target), variables))
+
+        return domain, service, data, target
+
+
+def _contains_template(value: Any) -> bool:
+    """Check if a value contains a template anywhere in its structure."""
+    if isinstance(value, str):
+        return is_template_string(value)
+    if isinstance(value, dict):
+        return any(_contains_template(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_contains_template(item) for item in value)
+    return False
+
+
+def _compile_value(hass: HomeAssistant, value: Any) -> Any:
+    """Replace template strings in a value with parsed Template objects."""
+    if isinstance(value, str):
+        if not is_template_string(value):
+            return value
+        template = Template(value, hass)
+        template.ensure_valid()
+        return template
+    if isinstance(value, dict):
+        return {key: _compile_value(hass, item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_compile_value(hass, item) for item in value]
+    return value
+
+
+def _split_mapping(
+    hass: HomeAssistant, mapping: Mapping[str, Any]
+) -> tuple[Mapping[str, Any], Mapping[str, Any]]:
+    """Split a mapping into frozen static values and compiled templated values."""
+    static = {}
+    templated = {}
+    for key, value in mapping.items():
+        if _contains_template(value):
+            templated[key] = _compile_value(hass, value)
+        else:
+            static[key] = value
+    return MappingProxyType(static), MappingProxyType(templated)
+
+
+def compile_action(hass: HomeAssistant, action_config: Any) -> ActionPlan:
+    """Validate an action config and compile it into an ActionPlan.
+
+    Raises vol.Invalid or TemplateError if the action cannot be compiled.
+    """
+    config = ACTION_SCHEMA(action_config)
+
+    service_name = (
+        config.get("action") or config.get("service") or config["service_template"]
+    )
+    service: str | Template
+    if is_template_string(service_name):
+        service = _compile_value(hass, service_name)
+    elif "." in service_name:
+        service = service_name
+    else:
+        raise vol.Invalid(f"Invalid service name: {service_name}")
+
+    data = {**config.get("data_template", {}), **config.get("data", {})}
+    target = dict(config.get("target", {}))
+    if ATTR_ENTITY_ID in config:
+        target.setdefault(ATTR_ENTITY_ID, config[ATTR_ENTITY_ID])
+
+    static_data, template_data = _split_mapping(hass, data)
+    static_target, template_target = _split_mapping(hass, target)
+
+    return ActionPlan(
+        config=MappingProxyType(action_config),
+        service=service,
+        static_data=static_data,
+        template_data=template_data,
+        static_target=static_target,
+        template_target=template_target,
+    )
+
+
+def compile_action_list(
+    hass: HomeAssistant, action_key: str, actions_list: Any
+) -> tuple[ActionPlan, ...]:
+    """Compile every valid action configured for an action key."""
+    if not actions_list:
+        return ()
+
+    if not isinstance(actions_list, list):
+        _LOGGER.warning("Actions for %s are not a list: %s", action_key, actions_list)
+        return ()
+
+    plans = []
+    for action_config in actions_list:
+        if not isinstance(action_config, dict):
+            _LOGGER.warning(
+                "Skipping invalid action config (not a dict): %s", action_config
+            )
+            continue
+
+        try:
+            plans.append(compile_action(hass, action_config))
+        except (vol.Invalid, TemplateError) as ex:
+            _LOGGER.error(
+                "Skipping invalid action %s with config %s: %s",
+                action_key,
+                action_config,
+                ex,
+            )
+
+    return tuple(plans)
@@ -0,0 +1,324 @@
+"""On-disk artwork cache for CC Player."""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+import io
+import logging
+import mimetypes
+import os
+import time
+from typing import Any
+
+import aiohttp
+from aiohttp.hdrs import CONTENT_TYPE
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+_LOGGER = logging.getLogger(__name__)
+
+# Directory under the Home Assistant config dir holding the cached images
+ARTWORK_CACHE_DIR = "ccplayer_artwork"
+# Least recently used images are evicted above this total size
+ARTWORK_CACHE_MAX_BYTES = 100 * 1024 * 1024
+# Images older than this are fetched again from the device
+ARTWORK_CACHE_MAX_AGE = 7 * 24 * 3600
+ARTWORK_FETCH_TIMEOUT = 10
+# Bounding boxes, in pixels, of the downscaled thumbnails kept next to
+# the original images
+THUMBNAIL_SIZES = (160, 320, 640)
+
+ArtworkImage = tuple[bytes | None, str | None]
+
+
+@dataclass(slots=True)
+class _CachedImage:
+    """A cached image file."""
+
+    filename: str
+    size: int
+    stored_at: float
+    content_type: str | None
+
+
+def select_thumbnail_size(pixels: int) -> int:
+    """Return the smallest thumbnail size covering the displayed size."""
+    for size in THUMBNAIL_SIZES:
+        if size >= pixels:
+            return size
+    return THUMBNAIL_SIZES[-1]
+
+
+def _downscale(data: bytes, size: int) -> tuple[bytes, str] | None:
+    """Re-encode an image to fit a size x size box.
+
+    Returns None when the original should be served as is: it already
+    fits, it cannot be decoded, or Pillow is not available.
+    """
+    try:
+        from PIL import Image  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if max(image.size) <= size:
+                return None
+            # Let the JPEG decoder skip the resolution we throw away anyway
+            image.draft("RGB", (size, size))
+            image.thumbnail((size, size))
+            output = io.BytesIO()
+            if image.mode in ("RGBA", "LA", "P"):
+                # Keep transparency
+                image.save(output, "PNG", optimize=True)
+                return output.getvalue(), "image/png"
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            image.save(output, "JPEG", quality=85, optimize=True)
+            return output.getvalue(), "image/jpeg"
+    except (OSError, ValueError, Image.DecompressionBombError) as ex:
+        _LOGGER.debug("Failed to downscale artwork: %s", ex)
+        return None
+
+
+class ArtworkCache:
+    """Images fetched from the players, kept on disk in LRU order.
+
+    Stored on the hub and shared by all players, so each image is fetched
+    from a device once and then served to every client through HA's media
+    player image proxy. Concurrent requests for the same image share one
+    fetch. Downscaled thumbnails are generated in the executor from the
+    cached original and cached alongside it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        directory: str,
+        max_bytes: int = ARTWORK_CACHE_MAX_BYTES,
+        max_age: float = ARTWORK_CACHE_MAX_AGE,
+    ) -> None:
+        """Initialize the cache, the directory is read on first use."""
+        self.hass = hass
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._images: OrderedDict[str, _CachedImage] = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._pending: dict[str, asyncio.Task[ArtworkImage]] = {}
+        self._stats = {
+            "hits": 0,
+            "fetches": 0,
+            "fetch_errors": 0,
+            "thumbnails": 0,
+            "evictions": 0,
+        }
+
+    async def async_get(self, url: str, size: int | None = None) -> ArtworkImage:
+        """Return the image bytes and content type for a URL.
+
+        With a size from THUMBNAIL_SIZES, return the image downscaled to fit
+        that box instead.
+        """
+        await self._async_load()
+
+        if size not in THUMBNAIL_SIZES:
+            size = None
+        key = sha256((url if size is None else f"{url}#{size}").encode()).hexdigest()
+        image = self._images.get(key)
+        if image is not None and time.time() - image.stored_at < self._max_age:
+            data = await self.hass.async_add_executor_job(self._read, image)
+            if data is not None:
+                self._images.move_to_end(key)
+                self._stats["hits"] += 1
+                return data, image.content_type
+            # The file was removed behind our back
+            self._forget(key)
+            image = None
+
+        if (task := self._pending.get(key)) is None:
+            task = self._pending[key] = self.hass.async_create_task(
+                self._async_fetch(key, url, image)
+                if size is None
+                else self._async_thumbnail(key, url, size)
+            )
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self, key: str, url: str, stale: _CachedImage | None
+    ) -> ArtworkImage:
+        """Fetch an image from its device and store it."""
+        self._stats["fetches"] += 1
+        session = async_get_clientsession(self.hass)
+        try:
+            async with asyncio.timeout(ARTWORK_FETCH_TIMEOUT):
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    data = await response.read()
+                    content_type = response.headers.get(CONTENT_TYPE)
+        except (TimeoutError, aiohttp.ClientError) as ex:
+            self._stats["fetch_errors"] += 1
+            _LOGGER.debug("Failed to fetch artwork %s: %s", url, ex)
+            # An expired image beats no image while the device is unreachable
+            if stale is not None:
+                data = await self.hass.async_add_executor_job(self._read, stale)
+                if data is not None:
+                    return data, stale.content_type
+            return None, None
+
+        if content_type:
+            content_type = content_type.split(";", 1)[0].strip()
+        if not content_type or not content_type.startswith("image/"):
+            _LOGGER.debug("Not caching %s with content type %s", url, content_type)
+            return data, content_type
+
+        image = await self.hass.async_add_executor_job(
+            self._write, key, data, content_type
+        )
+        if image is not None:
+            self._store(key, image)
+        return data, content_type
+
+    async def _async_thumbnail(self, key: str, url: str, size: int) -> ArtworkImage:
+        """Downscale the original image and store the thumbnail."""
+        data, content_type = await self.async_get(url)
+        if data is None or not content_type or not content_type.startswith("image/"):
+            return data, content_type
+
+        thumbnail = await self.hass.async_add_executor_job(_downscale, data, size)
+        if thumbnail is not None:
+            data, content_type = thumbnail
+            self._stats["thumbnails"] += 1
+        # Otherwise the original is served, cache it under this key too so it
+        # is not decoded again on every request
+        image = await self.hass.async_add_executor_job(
+            self._write, key, data, content_type
+        )
+        if image is not None:
+            self._store(key, image)
+        return data, content_type
+
+    @callback
+    def _store(self, key: str, image: _CachedImage) -> None:
+        """Index a written image and evict the least recently used ones."""
+        evicted = []
+        old_image = self._images.get(key)
+        if old_image is not None and old_image.filename != image.filename:
+            # Same URL now served with another content type
+            evicted.append(old_image.filename)
+
+        self._forget(key)
+        self._images[key] = image
+        self._total_bytes += image.size
+
+        while self._total_bytes > self._max_bytes and len(self._images) > 1:
+            old_key, old_image = next(iter(self._images.items()))
+            self._forget(old_key)
+            evicted.append(old_image.filename)
+        if evicted:
+            self._stats["evictions"] += len(evicted)
+            self.hass.async_add_executor_job(self._remove, evicted)
+
+    @callback
+    def _forget(self, key: str) -> None:
+        """Drop an image from the index."""
+        if (image := self._images.pop(key, None)) is not None:
+            self._total_bytes -= image.size
+
+    async def _async_load(self) -> None:
+        """Index the images already on disk."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            images, expired = await self.hass.async_add_executor_job(self._scan)
+            for key, image in images:
+                self._store(key, image)
+            if expired:
+                self.hass.async_add_executor_job(self._remove, expired)
+            self._loaded = True
+
+    def _scan(self) -> tuple[list[tuple[str, _CachedImage]], list[str]]:
+        """List the cached images, oldest first, and the expired files."""
+        images = []
+        expired = []
+        now = time.time()
+        try:
+            entries = list(os.scandir(self._directory))
+        except FileNotFoundError:
+            return images, expired
+
+        for entry in entries:
+            if not entry.is_file() or entry.name.endswith(".tmp"):
+                continue
+            stat = entry.stat()
+            if now - stat.st_mtime >= self._max_age:
+                expired.append(entry.name)
+                continue
+            key = entry.name.split(".", 1)[0]
+            images.append(
+                (
+                    key,
+                    _CachedImage(
+                        filename=entry.name,
+                        size=stat.st_size,
+                        stored_at=stat.st_mtime,
+                        content_type=mimetypes.guess_type(entry.name)[0],
+                    ),
+                )
+            )
+
+        # Access order is not persisted, so restart from storage order
+        images.sort(key=lambda item: item[1].stored_at)
+        return images, expired
+
+    def _read(self, image: _CachedImage) -> bytes | None:
+        """Read a cached image, None if it no longer exists."""
+        try:
+            with open(os.path.join(self._directory, image.filename), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, data: bytes, content_type: str) -> _CachedImage | None:
+        """Write an image atomically, named after its key and extension."""
+        filename = f"{key}{mimetypes.guess_extension(content_type) or ''}"
+        path = os.path.join(self._directory, filename)
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(f"{path}.tmp", "wb") as file:
+                file.write(data)
+            os.replace(f"{path}.tmp", path)
+        except OSError as ex:
+            _LOGGER.warning("Failed to write artwork cache file %s: %s", path, ex)
+            return None
+        return _CachedImage(
+            filename=filename,
+            size=len(data),
+            stored_at=time.time(),
+            content_type=content_type,
+        )
+
+    def _remove(self, filenames: list[str]) -> None:
+        """Delete evicted or expired image files."""
+        for filename in filenames:
+            try:
+                os.remove(os.path.join(self._directory, filename))
+            except FileNotFoundError:
+                pass
+
+    def diagnostics_data(self) -> dict[str, Any]:
+        """Return cache state for the diagnostics download."""
+        return {
+            "images": len(self._images),
+            "bytes": self._total_bytes,
+            "max_bytes": self._max_bytes,
+            "pending_fetches": len(self._pending),
+            **self._stats,
+        }
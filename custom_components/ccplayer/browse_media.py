@@ -0,0 +1,191 @@
+"""Browse media trees for CC Player."""
+
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+from homeassistant.components.media_player import BrowseError, MediaClass, MediaType
+from homeassistant.components.media_player.browse_media import BrowseMedia
+from homeassistant.core import HomeAssistant
+
+from .artwork import select_thumbnail_size
+from .media_queue import MediaQueue
+
+# Returns the image proxy URL for a media content type, id and image id
+ImageUrlBuilder = Callable[[str, str, str | None], str]
+
+SOURCES_NODE_ID = "ccplayer_sources"
+PLAYLISTS_NODE_ID = "ccplayer_playlists"
+
+# Directories with more children than this are split into page folders,
+# e.g. ccplayer_sources/page/2, and only the requested page is built
+BROWSE_PAGE_SIZE = 100
+PAGE_SEPARATOR = "/page/"
+# Size, in pixels, at which the media browser grid shows thumbnails
+BROWSE_THUMBNAIL_PIXELS = 150
+
+_T = TypeVar("_T")
+
+# Browse thumbnails ask the image proxy for this downscaled size
+_THUMBNAIL_IMAGE_ID = str(select_thumbnail_size(BROWSE_THUMBNAIL_PIXELS))
+
+
+def page_node_id(root_id: str, page: int) -> str:
+    """Return the media content id of a page folder."""
+    return f"{root_id}{PAGE_SEPARATOR}{page}"
+
+
+def root_node_id(node_id: str) -> str:
+    """Return the directory a media content id belongs to."""
+    return node_id.partition(PAGE_SEPARATOR)[0]
+
+
+def parse_node_id(node_id: str) -> tuple[str, int | None]:
+    """Split a media content id into its root id and 1-based page number.
+
+    Raises BrowseError if the page part is not a valid page number.
+    """
+    root_id, separator, page = node_id.partition(PAGE_SEPARATOR)
+    if not separator:
+        return root_id, None
+    if not page.isdigit() or int(page) < 1:
+        raise BrowseError(f"Invalid page in media content id: {node_id}")
+    return root_id, int(page)
+
+
+def _build_directory(
+    title: str,
+    node_id: str,
+    items: Sequence[_T],
+    page: int | None,
+    build_child: Callable[[_T], BrowseMedia],
+) -> BrowseMedia:
+    """Build a directory node, splitting large directories into pages."""
+    page_count = -(-len(items) // BROWSE_PAGE_SIZE)
+
+    if page is None and page_count > 1:
+        # Only the page folders, their children are built when expanded
+        children = [
+            BrowseMedia(
+                title=(
+                    f"{title} {number * BROWSE_PAGE_SIZE - BROWSE_PAGE_SIZE + 1}"
+                    f"-{min(number * BROWSE_PAGE_SIZE, len(items))}"
+                ),
+                media_class="directory",
+                media_content_id=page_node_id(node_id, number),
+                media_content_type="directory",
+                can_play=False,
+                can_expand=True,
+                children=[],
+            )
+            for number in range(1, page_count + 1)
+        ]
+        return BrowseMedia(
+            title=title,
+            media_class="directory",
+            media_content_id=node_id,
+            media_content_type="directory",
+            can_play=False,
+            can_expand=True,
+            children=children,
+        )
+
+    if page is None:
+        page_items = items
+        page_id = node_id
+        page_title = title
+    else:
+        if page > page_count:
+            raise BrowseError(f"Page {page} of {node_id} does not exist")
+        page_items = items[(page - 1) * BROWSE_PAGE_SIZE : page * BROWSE_PAGE_SIZE]
+        page_id = page_node_id(node_id, page)
+        page_title = f"{title} (page {page} of {page_count})"
+
+    return BrowseMedia(
+        title=page_title,
+        media_class="directory",
+        media_content_id=page_id,
+        media_content_type="directory",
+        can_play=False,
+        can_expand=True,
+        children=[build_child(item) for item in page_items],
+    )
+
+
+def resolve_thumbnail_url(hass: HomeAssistant, thumbnail: str | None) -> str | None:
+    """Ensure a device thumbnail URL is absolute."""
+    if not thumbnail or thumbnail.startswith(("http://", "https://")):
+        return thumbnail
+
+    if thumbnail.startswith("/"):
+        # Make relative URLs absolute
+        base_url = (
+            hass.config.external_url
+            or hass.config.internal_url
+            or "http://localhost:8123"
+        )
+        return f"{base_url}{thumbnail}"
+
+    # If it doesn't start with / or http, prepend http://
+    return f"http://{thumbnail}"
+
+
+def build_sources_node(
+    queue: MediaQueue, image_url: ImageUrlBuilder, page: int | None = None
+) -> BrowseMedia:
+    """Build the Sources directory, or one of its pages, from the media queue."""
+
+    def build_child(item: dict[str, Any]) -> BrowseMedia:
+        media_content_id = f"source:{MediaQueue.source_key(item)}"
+        return BrowseMedia(
+            title=item.get("title", f"Item {item.get('index', '')}"),
+            media_class=MediaClass.VIDEO,
+            media_content_id=media_content_id,
+            media_content_type=MediaType.VIDEO,
+            can_play=True,
+            can_expand=False,
+            thumbnail=(
+                image_url(MediaType.VIDEO, media_content_id, _THUMBNAIL_IMAGE_ID)
+                if item.get("thumbnail")
+                else None
+            ),
+            children=[],
+        )
+
+    return _build_directory("Sources", SOURCES_NODE_ID, queue.items, page, build_child)
+
+
+def build_playlists_node(
+    playlists: list[dict[str, Any]],
+    image_url: ImageUrlBuilder,
+    page: int | None = None,
+) -> BrowseMedia:
+    """Build the Playlists directory, or one of its pages."""
+
+    def build_child(playlist: dict[str, Any]) -> BrowseMedia:
+        name = playlist.get("title") or playlist.get("name") or ""
+        # Remove trailing .json if present
+        if name.endswith(".json"):
+            name = name[:-5]
+        # Append description if available
+        description = playlist.get("description")
+        if description:
+            name = f"{name} ({description})"
+        media_content_id = f"playlist:{playlist.get('index')}"
+        return BrowseMedia(
+            title=name,
+            media_class="playlist",
+            media_content_id=media_content_id,
+            media_content_type="playlist",
+            can_play=True,
+            can_expand=False,
+            thumbnail=(
+                image_url("playlist", media_content_id, _THUMBNAIL_IMAGE_ID)
+                if playlist.get("thumbnail")
+                else None
+            ),
+            children=[],
+        )
+
+    return _build_directory(
+        "Playlists", PLAYLISTS_NODE_ID, playlists, page, build_child
+    )
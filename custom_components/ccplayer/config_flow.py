@@ -11,33 +11,31 @@ from homeassistant.components import mqtt
 from homeassistant.config_entries import ConfigEntry, ConfigFlow
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.device_registry import async_get as async_get_device_registry
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 
 from .const import (
     CONF_ACTIONS,
-    CONF_MEDIA_ALBUM_ENTITY,
-    CONF_MEDIA_ARTIST_ENTITY,
-    CONF_MEDIA_DURATION_ENTITY,
-    CONF_MEDIA_IMAGE_ENTITY,
-    CONF_MEDIA_POSITION_ENTITY,
-    CONF_MEDIA_TITLE_ENTITY,
-    CONF_MUTE_ENTITY,
-    CONF_PLAYER_STATE_ENTITY,
-    CONF_POWER_ENTITY,
-    CONF_SOURCE_ENTITY,
-    CONF_SOURCE_LIST_ENTITY,
-    CONF_VOLUME_ENTITY,
-    CONF_VOLUME_STEP,
     DEFAULT_NAME,
     DOMAIN,
 )
+from .discovery import (
+    async_build_entry_options,
+    async_find_device,
+    guess_yan_device_id,
+)
+from .hub import YAN_STATUS_WILDCARD
 from .options_flow import CCPlayerOptionsFlow
 
 _LOGGER = logging.getLogger(__name__)
 
+# Topic the YAN clients announce themselves on, see manifest.json
+YAN_DISCOVERY_TOPIC = "yan/discovery/#"
+# How long the fleet step listens for YAN clients
+FLEET_SCAN_TIME = 3.0
+
 
 class CCPlayerConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for CC Player."""
@@ -46,6 +44,7 @@ class CCPlayerConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize flow."""
         self._discovered_device_info: dict | None = None
         self._mqtt_discovered_prefix: str | None = None
+        self._devices: dict[str, dict] | None = None
 
     VERSION = 1
 
@@ -53,16 +52,25 @@ class CCPlayerConfigFlow(ConfigFlow, domain=DOMAIN):
         self, discovery_info: MqttServiceInfo
     ) -> ConfigFlowResult:
         """Handle a flow initialized by MQTT discovery."""
-        if self._async_in_progress() or self._async_current_entries():
-            return self.async_abort(reason="single_instance_allowed")
+        try:
+            data = json.loads(discovery_info.payload)
+        except ValueError:
+            return self.async_abort(reason="invalid_discovery_info")
 
-        await self.async_set_unique_id(DOMAIN)
+        device_id = data.get("deviceUniqueID") if isinstance(data, dict) else None
+        if not device_id:
+            return self.async_abort(reason="invalid_discovery_info")
 
-        payload_holder = discovery_info.payload
-        data = json.loads(payload_holder)
+        # One entry per YAN device
+        await self.async_set_unique_id(device_id)
+        self._abort_if_unique_id_configured()
+        for entry in self._async_current_entries(include_ignore=False):
+            if entry.data.get("device_id") == device_id:
+                return self.async_abort(reason="already_configured")
 
-        self._mqtt_discovered_prefix = data.get("deviceUniqueID")
+        self._mqtt_discovered_prefix = device_id
         self._discovered_device_id = self._mqtt_discovered_prefix  # Save for later
+        self.context["title_placeholders"] = {"name": device_id}
 
         # Proceed to confirmation step
         return await self.async_step_confirm()
@@ -80,16 +88,7 @@ class CCPlayerConfigFlow(ConfigFlow, domain=DOMAIN):
         # This is the first time showing the confirm step after MQTT discovery (or manual start)
         description_placeholders = {}
         if self._mqtt_discovered_prefix:
-            device_registry = async_get_device_registry(self.hass)
-            matching_device = None
-            for dev in device_registry.devices.values():
-                if dev.identifiers:
-                    for ident_tuple in dev.identifiers:
-                        if len(ident_tuple) == 2 and self._mqtt_discovered_prefix in ident_tuple[1]:
-                            matching_device = dev
-                            break
-                if matching_device:
-                    break
+            matching_device = async_find_device(self.hass, self._mqtt_discovered_prefix)
 
             if matching_device:
                 self._discovered_device_info = {
@@ -114,20 +113,34 @@ class CCPlayerConfigFlow(ConfigFlow, domain=DOMAIN):
             # No data_schema needed for a simple confirmation, unless we want to add options here.
         )
 
+    @callback
+    def _async_get_devices(self) -> dict[str, dict]:
+        """Return device_id -> (name, identifiers), built once per flow."""
+        if self._devices is None:
+            device_registry = async_get_device_registry(self.hass)
+            self._devices = {
+                dev.id: {
+                    "name": dev.name or dev.id,
+                    "identifiers": next(iter(dev.identifiers)),
+                }
+                for dev in device_registry.devices.values()
+                if dev.identifiers
+            }
+        return self._devices
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
+        if user_input is None and not self._discovered_device_info:
+            # Manual start: set up one player, or every discovered YAN client
+            return self.async_show_menu(
+                step_id="user", menu_options=["device", "fleet"]
+            )
+        return await self.async_step_device(user_input)
+
+    async def async_step_device(self, user_input=None):
+        """Set up a player for one device."""
         errors = {}
-        device_registry = async_get_device_registry(self.hass)
-        entity_registry = async_get_entity_registry(self.hass)
-        # Build a mapping of device_id -> (name, identifiers)
-        devices = {
-            dev.id: {
-                "name": dev.name or dev.id,
-                "identifiers": list(dev.identifiers)[0] if dev.identifiers else None,
-            }
-            for dev in device_registry.devices.values()
-            if dev.identifiers
-        }
+        devices = self._async_get_devices()
         device_choices = {dev_id: info["name"] for dev_id, info in devices.items()}
 
         if user_input is not None:
@@ -136,115 +149,17 @@ class CCPlayerConfigFlow(ConfigFlow, domain=DOMAIN):
                 device_id = self._discovered_device_id
             else:
                 # Try to extract from selected device name or identifiers
-                selected_device_id = user_input["linked_device_id"]
-                dev_name = devices[selected_device_id]["name"]
-                # Try to extract YANClient-xxxxxxx from name or identifiers
-                import re
-                match = re.search(r"(YANClient-\d+)", dev_name)
-                if not match and devices[selected_device_id]["identifiers"]:
-                    ident = devices[selected_device_id]["identifiers"]
-                    if isinstance(ident, tuple):
-                        match = re.search(r"(YANClient-\d+)", ident[1])
-                device_id = match.group(1) if match else dev_name.replace(" ", "_").lower()
-
-            # Build entity fragment from device_id
-            entity_fragment = device_id.replace("-", "_").lower()  # e.g., yanclient_40074106
-            if not entity_fragment.startswith("yan_"):
-                entity_fragment = f"yan_{entity_fragment}"
-
-            # Helper to find entity_id by domain and suffix
-            def find_entity(domain: str, suffix: str) -> str | None:
-                for ent in entity_registry.entities.values():
-                    if ent.domain == domain and ent.entity_id.endswith(suffix):
-                        return ent.entity_id
-                return None
-
-            # Fill entity fields using the entity_fragment
-            default_entities = {
-                CONF_POWER_ENTITY: find_entity("switch", f"{entity_fragment}_power")
-                or find_entity("switch", f"{entity_fragment}_power_control")
-                or "",
-                CONF_PLAYER_STATE_ENTITY: find_entity(
-                    "sensor", f"{entity_fragment}_playback_state"
-                )
-                or "",
-                CONF_MEDIA_TITLE_ENTITY: find_entity(
-                    "sensor", f"{entity_fragment}_media_title"
-                )
-                or "",
-                CONF_MEDIA_IMAGE_ENTITY: find_entity(
-                    "image", f"{entity_fragment}_media_thumbnail"
-                )
-                or "",
-                CONF_MEDIA_POSITION_ENTITY: find_entity(
-                    "sensor", f"{entity_fragment}_media_position"
+                selected_device = devices[user_input["linked_device_id"]]
+                device_id = guess_yan_device_id(
+                    selected_device["name"], selected_device["identifiers"]
                 )
-                or "",
-                CONF_MEDIA_DURATION_ENTITY: find_entity(
-                    "sensor", f"{entity_fragment}_media_duration"
-                )
-                or "",
-                CONF_MUTE_ENTITY: find_entity("switch", f"{entity_fragment}_mute")
-                or find_entity("switch", f"{entity_fragment}_mute_control")
-                or "",
-                CONF_VOLUME_ENTITY: find_entity("number", f"{entity_fragment}_volume")
-                or "",
-            }
 
-            # Fill actions (hardcoded except for entity_fragment)
-            actions = {
-                "play_action": [
-                    {
-                        "action": "button.press",
-                        "data": {},
-                        "metadata": {},
-                        "target": {"entity_id": f"button.{entity_fragment}_play"},
-                    }
-                ],
-                "pause_action": [
-                    {
-                        "action": "button.press",
-                        "data": {},
-                        "metadata": {},
-                        "target": {"entity_id": f"button.{entity_fragment}_pause"},
-                    }
-                ],
-                "stop_action": [
-                    {
-                        "action": "button.press",
-                        "data": {},
-                        "metadata": {},
-                        "target": {"entity_id": f"button.{entity_fragment}_stop"},
-                    }
-                ],
-                "seek_action": [
-                    {
-                        "action": "number.set_value",
-                        "data": {"value": "{{seek_position}}"},
-                        "metadata": {},
-                        "target": {"entity_id": f"number.{entity_fragment}_media_seek"},
-                    }
-                ],
-                "shuffle_set_action": [
-                    {
-                        "action": "switch.toggle",   # Corrected to switch.toggle        
-                        "data": {},
-                        "metadata": {},
-                        "target": {"entity_id": f"switch.{entity_fragment}_shuffle"},
-                    }
-                ],
-                "play_media_action": [
-                    {
-                        "action": "text.set_value",
-                        "data": {"value": "{{media_id}}"},
-                        "metadata": {},
-                        "target": {"entity_id": f"text.{entity_fragment}_load_media_url"},
-                    }
-                ],
-            }
+            await self.async_set_unique_id(device_id)
+            self._abort_if_unique_id_configured()
 
-            # Save device, identifiers, guessed entities, actions, and device_id as options/data
-            options = {**default_entities, "actions": actions}
+            options = async_build_entry_options(
+                self.hass, device_id, user_input["linked_device_id"]
+            )
             return self.async_create_entry(
                 title=user_input["name"],
                 data={
@@ -285,11 +200,116 @@ class CCPlayerConfigFlow(ConfigFlow, domain=DOMAIN):
 
 
         return self.async_show_form(
-            step_id="user",
+            step_id="device",
             data_schema=vol.Schema(schema_fields),
             errors=errors,
         )
 
+    async def _async_scan_fleet(self) -> set[str]:
+        """Collect the ids of the YAN clients announcing themselves on MQTT."""
+        found: set[str] = set()
+
+        @callback
+        def collect(msg: mqtt.ReceiveMessage) -> None:
+            parts = msg.topic.split("/")
+            if parts[1] != "discovery":
+                # yan/<device_id>/status/...
+                found.add(parts[1])
+                return
+            try:
+                data = json.loads(msg.payload)
+            except ValueError:
+                return
+            if isinstance(data, dict) and data.get("deviceUniqueID"):
+                found.add(data["deviceUniqueID"])
+
+        unsubs = [
+            await mqtt.async_subscribe(self.hass, topic, collect, 1)
+            for topic in (YAN_DISCOVERY_TOPIC, YAN_STATUS_WILDCARD)
+        ]
+        try:
+            # Retained discovery messages arrive right away, live status
+            # messages within the devices' publish interval
+            await asyncio.sleep(FLEET_SCAN_TIME)
+        finally:
+            for unsub in unsubs:
+                unsub()
+
+        # Clients already announced through MQTT discovery flows
+        for flow in self._async_in_progress(include_uninitialized=True):
+            if flow["context"].get("source") == config_entries.SOURCE_MQTT and (
+                unique_id := flow["context"].get("unique_id")
+            ):
+                found.add(unique_id)
+
+        return found
+
+    async def async_step_fleet(self, user_input=None) -> ConfigFlowResult:
+        """Set up a player for every discovered YAN client in one pass."""
+        if user_input is not None:
+            device_ids = user_input["devices"]
+            for device_id in device_ids:
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_IMPORT},
+                        data={"device_id": device_id},
+                    )
+                )
+            return self.async_abort(
+                reason="fleet_onboarding_started",
+                description_placeholders={"count": str(len(device_ids))},
+            )
+
+        if not mqtt.is_connected(self.hass):
+            return self.async_abort(reason="mqtt_not_connected")
+
+        # Dedupe against every existing entry, ignored ones included
+        configured = set()
+        for entry in self._async_current_entries(include_ignore=True):
+            configured.add(entry.unique_id)
+            configured.add(entry.data.get("device_id"))
+
+        device_ids = sorted((await self._async_scan_fleet()) - configured)
+        if not device_ids:
+            return self.async_abort(reason="no_devices_found")
+
+        return self.async_show_form(
+            step_id="fleet",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("devices", default=device_ids): cv.multi_select(
+                        {device_id: device_id for device_id in device_ids}
+                    )
+                }
+            ),
+            description_placeholders={"count": str(len(device_ids))},
+        )
+
+    async def async_step_import(self, import_data: dict) -> ConfigFlowResult:
+        """Create the entry of one YAN client started by the fleet step."""
+        device_id = import_data["device_id"]
+        # Takes over a pending MQTT discovery flow of the same device, which
+        # is aborted once this entry is created
+        await self.async_set_unique_id(device_id, raise_on_progress=False)
+        self._abort_if_unique_id_configured()
+
+        device = async_find_device(self.hass, device_id)
+        name = (device.name if device else None) or device_id
+        linked_device_id = device.id if device else None
+        return self.async_create_entry(
+            title=name,
+            data={
+                "name": name,
+                "linked_device_id": linked_device_id,
+                "linked_device_identifier": (
+                    next(iter(device.identifiers), None) if device else None
+                ),
+                "device_id": device_id,
+            },
+            options=async_build_entry_options(self.hass, device_id, linked_device_id),
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
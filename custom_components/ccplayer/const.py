@@ -9,6 +9,13 @@ CONF_SOURCE_ENTITY = "source_entity"
 CONF_SOURCE_LIST_ENTITY = "source_list_entity"
 CONF_VOLUME_ENTITY = "volume_entity"
 CONF_VOLUME_STEP = "volume_step"
+CONF_POSITION_EXTRAPOLATION = "position_extrapolation"
+CONF_POSITION_DRIFT_TOLERANCE = "position_drift_tolerance"
+CONF_OPTIMISTIC_TRANSPORT = "optimistic_transport"
+CONF_OPTIMISTIC_WINDOW = "optimistic_window"
+CONF_DIRECT_MQTT_COMMANDS = "direct_mqtt_commands"
+CONF_STATE_FROM_MQTT = "state_from_mqtt"
+CONF_MAX_PAYLOAD_SIZE = "max_payload_size"
 CONF_MUTE_ENTITY = "mute_entity"
 CONF_MEDIA_TITLE_ENTITY = "media_title_entity"
 CONF_MEDIA_ARTIST_ENTITY = "media_artist_entity"
@@ -58,6 +65,23 @@ CONF_CLOSE_ACTION = "close_action"
 # Default values
 DEFAULT_NAME = "CC Player"
 DEFAULT_VOLUME_STEP = 0.05
+DEFAULT_POSITION_EXTRAPOLATION = False
+DEFAULT_POSITION_DRIFT_TOLERANCE = 2.0  # seconds
+DEFAULT_OPTIMISTIC_TRANSPORT = False
+DEFAULT_OPTIMISTIC_WINDOW = 3.0  # seconds
+DEFAULT_DIRECT_MQTT_COMMANDS = False
+DEFAULT_STATE_FROM_MQTT = False
+DEFAULT_MAX_PAYLOAD_SIZE = 1024  # KiB
+
+# YAN device command topics: yan/<device_id>/command/<command>
+YAN_COMMAND_PLAY = "media_play"
+YAN_COMMAND_PAUSE = "media_pause"
+YAN_COMMAND_STOP = "media_stop"
+YAN_COMMAND_NEXT = "media_next"
+YAN_COMMAND_PREVIOUS = "media_previous"
+YAN_COMMAND_SEEK = "media_seek"
+YAN_COMMAND_VOLUME = "volume_set"
+YAN_COMMAND_MUTE = "volume_mute"
 
 # Device information constants
 DEVICE_MANUFACTURER = "Custom Component"
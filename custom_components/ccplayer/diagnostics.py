@@ -0,0 +1,27 @@
+"""Diagnostics support for CC Player."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .hub import CCPlayerHub
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    diagnostics: dict[str, Any] = {
+        "config_entry_data": dict(entry.data),
+        "config_entry_options": dict(entry.options),
+    }
+
+    hub: CCPlayerHub = hass.data[DOMAIN]
+    player = hub.players.get(entry.entry_id)
+    if player is not None:
+        diagnostics["player"] = player.diagnostics_data()
+    diagnostics["artwork_cache"] = hub.artwork.diagnostics_data()
+
+    return diagnostics
@@ -0,0 +1,200 @@
+"""Discovery of YAN device entities for the CC Player config flow."""
+
+from collections.abc import Iterable
+import re
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import (
+    CONF_MEDIA_DURATION_ENTITY,
+    CONF_MEDIA_IMAGE_ENTITY,
+    CONF_MEDIA_POSITION_ENTITY,
+    CONF_MEDIA_TITLE_ENTITY,
+    CONF_MUTE_ENTITY,
+    CONF_PLAYER_STATE_ENTITY,
+    CONF_POWER_ENTITY,
+    CONF_VOLUME_ENTITY,
+)
+
+YAN_DEVICE_ID_PATTERN = re.compile(r"(YANClient-\d+)")
+
+
+def yan_entity_fragment(device_id: str) -> str:
+    """Return the entity id fragment of a YAN device, e.g. yan_yanclient_40074106."""
+    entity_fragment = device_id.replace("-", "_").lower()
+    if not entity_fragment.startswith("yan_"):
+        entity_fragment = f"yan_{entity_fragment}"
+    return entity_fragment
+
+
+def guess_yan_device_id(name: str, identifier: Any) -> str:
+    """Extract YANClient-xxxxxxx from a device name or identifier."""
+    match = YAN_DEVICE_ID_PATTERN.search(name)
+    if not match and isinstance(identifier, tuple):
+        match = YAN_DEVICE_ID_PATTERN.search(identifier[1])
+    return match.group(1) if match else name.replace(" ", "_").lower()
+
+
+def _index_by_tail(
+    entries: Iterable[er.RegistryEntry], fragment: str
+) -> dict[tuple[str, str], str]:
+    """Map (domain, object id from the fragment on) to entity ids in one pass."""
+    index: dict[tuple[str, str], str] = {}
+    for entry in entries:
+        domain, _, object_id = entry.entity_id.partition(".")
+        if (start := object_id.rfind(fragment)) != -1:
+            index.setdefault((domain, object_id[start:]), entry.entity_id)
+    return index
+
+
+class EntityIndex:
+    """Entities of a YAN device, looked up by domain and entity id suffix.
+
+    Entities of the linked device are resolved through the registry's
+    device linkage. Entities not found there, e.g. when the device is not
+    linked, are looked up in an index of the whole registry, built once in
+    a single pass.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, fragment: str, linked_device_id: str | None = None
+    ) -> None:
+        """Index the entities of the linked device."""
+        self._registry = er.async_get(hass)
+        self._fragment = fragment
+        self._device_index: dict[tuple[str, str], str] = {}
+        if linked_device_id:
+            self._device_index = _index_by_tail(
+                er.async_entries_for_device(self._registry, linked_device_id),
+                fragment,
+            )
+        self._registry_index: dict[tuple[str, str], str] | None = None
+
+    def find(self, domain: str, suffix: str) -> str | None:
+        """Return the entity id of a domain ending with the suffix.
+
+        The suffix must start with the fragment, e.g. yan_yanclient_1_power.
+        """
+        if entity_id := self._device_index.get((domain, suffix)):
+            return entity_id
+
+        if self._registry_index is None:
+            self._registry_index = _index_by_tail(
+                self._registry.entities.values(), self._fragment
+            )
+        return self._registry_index.get((domain, suffix))
+
+
+def async_find_device(hass: HomeAssistant, device_id: str) -> dr.DeviceEntry | None:
+    """Return the registry device of a YAN device id, if there is one."""
+    device_registry = dr.async_get(hass)
+    # Devices created by MQTT discovery are identified by the id itself
+    if device := device_registry.async_get_device(identifiers={("mqtt", device_id)}):
+        return device
+
+    for device in device_registry.devices.values():
+        for identifier in device.identifiers:
+            # Whole ids only, YANClient-1 must not match YANClient-12
+            if len(identifier) == 2 and identifier[1] == device_id:
+                return device
+    return None
+
+
+def async_build_entry_options(
+    hass: HomeAssistant, device_id: str, linked_device_id: str | None
+) -> dict[str, Any]:
+    """Return the entry options auto-mapped to a YAN device's entities."""
+    entity_fragment = yan_entity_fragment(device_id)
+
+    # Find entity_id by domain and suffix, on the linked device first
+    find_entity = EntityIndex(hass, entity_fragment, linked_device_id).find
+
+    # Fill entity fields using the entity_fragment
+    default_entities = {
+        CONF_POWER_ENTITY: find_entity("switch", f"{entity_fragment}_power")
+        or find_entity("switch", f"{entity_fragment}_power_control")
+        or "",
+        CONF_PLAYER_STATE_ENTITY: find_entity(
+            "sensor", f"{entity_fragment}_playback_state"
+        )
+        or "",
+        CONF_MEDIA_TITLE_ENTITY: find_entity(
+            "sensor", f"{entity_fragment}_media_title"
+        )
+        or "",
+        CONF_MEDIA_IMAGE_ENTITY: find_entity(
+            "image", f"{entity_fragment}_media_thumbnail"
+        )
+        or "",
+        CONF_MEDIA_POSITION_ENTITY: find_entity(
+            "sensor", f"{entity_fragment}_media_position"
+        )
+        or "",
+        CONF_MEDIA_DURATION_ENTITY: find_entity(
+            "sensor", f"{entity_fragment}_media_duration"
+        )
+        or "",
+        CONF_MUTE_ENTITY: find_entity("switch", f"{entity_fragment}_mute")
+        or find_entity("switch", f"{entity_fragment}_mute_control")
+        or "",
+        CONF_VOLUME_ENTITY: find_entity("number", f"{entity_fragment}_volume")
+        or "",
+    }
+
+    # Fill actions (hardcoded except for entity_fragment)
+    actions = {
+        "play_action": [
+            {
+                "action": "button.press",
+                "data": {},
+                "metadata": {},
+                "target": {"entity_id": f"button.{entity_fragment}_play"},
+            }
+        ],
+        "pause_action": [
+            {
+                "action": "button.press",
+                "data": {},
+                "metadata": {},
+                "target": {"entity_id": f"button.{entity_fragment}_pause"},
+            }
+        ],
+        "stop_action": [
+            {
+                "action": "button.press",
+                "data": {},
+                "metadata": {},
+                "target": {"entity_id": f"button.{entity_fragment}_stop"},
+            }
+        ],
+        "seek_action": [
+            {
+                "action": "number.set_value",
+                "data": {"value": "{{seek_position}}"},
+                "metadata": {},
+                "target": {"entity_id": f"number.{entity_fragment}_media_seek"},
+            }
+        ],
+        "shuffle_set_action": [
+            {
+                "action": "switch.toggle",   # Corrected to switch.toggle        
+                "data": {},
+                "metadata": {},
+                "target": {"entity_id": f"switch.{entity_fragment}_shuffle"},
+            }
+        ],
+        "play_media_action": [
+            {
+                "action": "text.set_value",
+                "data": {"value": "{{media_id}}"},
+                "metadata": {},
+                "target": {"entity_id": f"text.{entity_fragment}_load_media_url"},
+            }
+        ],
+    }
+
+
+    # Guessed entities and actions become the entry options
+    return {**default_entities, "actions": actions}
@@ -0,0 +1,123 @@
+"""Shared MQTT hub for CC Player."""
+
+import asyncio
+from collections.abc import Callable, Iterable
+import logging
+from typing import Any
+
+from homeassistant.components import mqtt
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .artwork import ARTWORK_CACHE_DIR, ArtworkCache
+from .perf import PlayerCounters
+
+_LOGGER = logging.getLogger(__name__)
+
+# Status topics of every YAN device, e.g. for discovering the fleet
+YAN_STATUS_WILDCARD = "yan/+/status/#"
+# Status topics of one subtopic across every YAN device
+YAN_STATUS_SUBTOPIC = "yan/+/status/{}"
+# Deltas only make sense on top of the snapshot before them, never replay one
+NOT_REPLAYED_SUBTOPICS = frozenset({"media_queue/delta"})
+
+StatusHandler = Callable[[str, mqtt.ReceiveMessage], None]
+
+
+class CCPlayerHub:
+    """Route yan/<device_id>/status/ messages to the players of each device.
+
+    Stored in hass.data[DOMAIN]. Holds one MQTT subscription per status
+    subtopic that registered players consume, shared by all of them, so
+    subscriptions do not grow with the size of the fleet.
+
+    The broker sends retained messages once per subscription, so the hub
+    keeps the last message of each topic and replays it to players that
+    register after the subscription was made.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        # Players by config entry id, for diagnostics
+        self.players: dict[str, Any] = {}
+        # Performance counters by config entry id, shared by a player and
+        # its diagnostic sensors
+        self.counters: dict[str, PlayerCounters] = {}
+        # Artwork shared by all players, so each image is fetched once
+        self.artwork = ArtworkCache(hass, hass.config.path(ARTWORK_CACHE_DIR))
+        # Handlers by device id, each with the subtopics it consumes
+        self._handlers: dict[str, list[tuple[StatusHandler, frozenset[str]]]] = {}
+        # Subscriptions by subtopic, and the last message by subtopic and device
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._last_messages: dict[str, dict[str, mqtt.ReceiveMessage]] = {}
+        self._lock = asyncio.Lock()
+
+    @callback
+    def counters_for(self, entry_id: str) -> PlayerCounters:
+        """Return the counters of a config entry's player, creating them."""
+        if (counters := self.counters.get(entry_id)) is None:
+            counters = self.counters[entry_id] = PlayerCounters()
+        return counters
+
+    async def async_register(
+        self, device_id: str, handler: StatusHandler, subtopics: Iterable[str]
+    ) -> CALLBACK_TYPE:
+        """Register a status handler for a device and return its remover.
+
+        The handler only receives the given subtopics, starting with the
+        last message of each that arrived before it registered.
+        """
+        registration = (handler, frozenset(subtopics))
+        self._handlers.setdefault(device_id, []).append(registration)
+
+        for subtopic in registration[1]:
+            if subtopic in NOT_REPLAYED_SUBTOPICS:
+                continue
+            if msg := self._last_messages.get(subtopic, {}).get(device_id):
+                handler(subtopic, msg)
+
+        async with self._lock:
+            for subtopic in sorted(registration[1] - self._unsubs.keys()):
+                topic = YAN_STATUS_SUBTOPIC.format(subtopic)
+                _LOGGER.debug("Subscribing to MQTT topic: %s", topic)
+                self._unsubs[subtopic] = await mqtt.async_subscribe(
+                    self.hass, topic, self._handle_message, 1
+                )
+
+        @callback
+        def remove_handler() -> None:
+            """Remove the handler and drop the subscriptions left unused."""
+            handlers = self._handlers.get(device_id, [])
+            if registration in handlers:
+                handlers.remove(registration)
+            if not handlers:
+                self._handlers.pop(device_id, None)
+
+            consumed = {
+                subtopic
+                for registrations in self._handlers.values()
+                for _, handler_subtopics in registrations
+                for subtopic in handler_subtopics
+            }
+            for subtopic in self._unsubs.keys() - consumed:
+                self._unsubs.pop(subtopic)()
+                # A new subscription gets the retained messages again
+                self._last_messages.pop(subtopic, None)
+
+        return remove_handler
+
+    @callback
+    def _handle_message(self, msg: mqtt.ReceiveMessage) -> None:
+        """Dispatch a status message to the handlers of its device."""
+        # yan/<device_id>/status/<subtopic>
+        parts = msg.topic.split("/", 3)
+        if len(parts) != 4 or parts[2] != "status":
+            return
+
+        device_id, subtopic = parts[1], parts[3]
+        if subtopic not in NOT_REPLAYED_SUBTOPICS:
+            self._last_messages.setdefault(subtopic, {})[device_id] = msg
+
+        for handler, subtopics in tuple(self._handlers.get(device_id, ())):
+            if subtopic in subtopics:
+                handler(subtopic, msg)
@@ -2,9 +2,11 @@
 
 import json
 import logging
+import time
 
-from typing import Any
-from copy import deepcopy
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime
+from typing import Any, NamedTuple
 
 from homeassistant.components import media_source
 from homeassistant.components import mqtt
@@ -27,10 +29,14 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_ON,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_call_later,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.service import async_call_from_config
 from homeassistant import util
 from homeassistant.components.media_player.browse_media import (  # noqa: F401
@@ -39,9 +45,30 @@ from homeassistant.components.media_player.browse_media import (  # noqa: F401
     SearchMediaQuery,
     async_process_play_media_url,
 )
+from .actions import ActionPlan, compile_action_list
+from .browse_media import (
+    PLAYLISTS_NODE_ID,
+    SOURCES_NODE_ID,
+    build_playlists_node,
+    build_sources_node,
+    parse_node_id,
+    resolve_thumbnail_url,
+    root_node_id,
+)
+from .hub import CCPlayerHub
+from .media_queue import MediaQueue
+from .payloads import (
+    DECODE_EXECUTOR_THRESHOLD,
+    PLAYLIST_SCHEMA,
+    QUEUE_ITEM_SCHEMA,
+    valid_entries,
+)
+from .playlists import PlaylistCache
 from .const import (
     CONF_ACTIONS,
     CONF_CLEAR_PLAYLIST_ACTION,
+    CONF_DIRECT_MQTT_COMMANDS,
+    CONF_MAX_PAYLOAD_SIZE,
     CONF_MEDIA_ALBUM_ENTITY,
     CONF_MEDIA_ARTIST_ENTITY,
     CONF_MEDIA_DURATION_ENTITY,
@@ -50,11 +77,15 @@ from .const import (
     CONF_MEDIA_TITLE_ENTITY,
     CONF_MUTE_ENTITY,
     CONF_NEXT_ACTION,
+    CONF_OPTIMISTIC_TRANSPORT,
+    CONF_OPTIMISTIC_WINDOW,
     CONF_PAUSE_ACTION,
     CONF_PLAY_ACTION,
     CONF_PLAY_MEDIA_ACTION,
     CONF_PLAY_PAUSE_ACTION,
     CONF_PLAYER_STATE_ENTITY,
+    CONF_POSITION_DRIFT_TOLERANCE,
+    CONF_POSITION_EXTRAPOLATION,
     CONF_POWER_ENTITY,
     CONF_PREVIOUS_ACTION,
     CONF_REPEAT_SET_ACTION,
@@ -62,16 +93,33 @@ from .const import (
     CONF_SHUFFLE_SET_ACTION,
     CONF_SOURCE_ENTITY,
     CONF_SOURCE_LIST_ENTITY,
+    CONF_STATE_FROM_MQTT,
     CONF_STOP_ACTION,
     CONF_TOGGLE_ACTION,
     CONF_VOLUME_ENTITY,
     CONF_VOLUME_STEP,
+    DEFAULT_DIRECT_MQTT_COMMANDS,
+    DEFAULT_MAX_PAYLOAD_SIZE,
     DEFAULT_NAME,
+    DEFAULT_OPTIMISTIC_TRANSPORT,
+    DEFAULT_OPTIMISTIC_WINDOW,
+    DEFAULT_POSITION_DRIFT_TOLERANCE,
+    DEFAULT_POSITION_EXTRAPOLATION,
+    DEFAULT_STATE_FROM_MQTT,
+    DEFAULT_VOLUME_STEP,
     DEVICE_MANUFACTURER,
     DEVICE_MODEL,
     DEVICE_NAME_DEFAULT,
     DEVICE_SW_VERSION,
     DOMAIN,
+    YAN_COMMAND_MUTE,
+    YAN_COMMAND_NEXT,
+    YAN_COMMAND_PAUSE,
+    YAN_COMMAND_PLAY,
+    YAN_COMMAND_PREVIOUS,
+    YAN_COMMAND_SEEK,
+    YAN_COMMAND_STOP,
+    YAN_COMMAND_VOLUME,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -92,6 +140,132 @@ PLAYER_STATE_MAP = {
     "false": MediaPlayerState.OFF,
 }
 
+# Commands published to yan/<device_id>/command/<command> by the direct
+# MQTT backend, and the payloads that never change
+YAN_COMMANDS = (
+    YAN_COMMAND_PLAY,
+    YAN_COMMAND_PAUSE,
+    YAN_COMMAND_STOP,
+    YAN_COMMAND_NEXT,
+    YAN_COMMAND_PREVIOUS,
+    YAN_COMMAND_SEEK,
+    YAN_COMMAND_VOLUME,
+    YAN_COMMAND_MUTE,
+)
+YAN_MUTE_PAYLOADS = {
+    True: json.dumps({"value": True}),
+    False: json.dumps({"value": False}),
+}
+
+# Status subtopics under yan/<device_id>/status/ and the role each one feeds
+YAN_STATUS_ROLES = {
+    "power": CONF_POWER_ENTITY,
+    "playback_state": CONF_PLAYER_STATE_ENTITY,
+    "volume": CONF_VOLUME_ENTITY,
+    "mute": CONF_MUTE_ENTITY,
+    "media_title": CONF_MEDIA_TITLE_ENTITY,
+    "media_artist": CONF_MEDIA_ARTIST_ENTITY,
+    "media_album": CONF_MEDIA_ALBUM_ENTITY,
+    "media_position": CONF_MEDIA_POSITION_ENTITY,
+    "media_duration": CONF_MEDIA_DURATION_ENTITY,
+}
+
+# Range of volume values published by YAN devices
+YAN_VOLUME_RANGE = (0.0, 100.0)
+
+# Status subtopics carrying the playlists and media queue, always consumed
+YAN_SNAPSHOT_SUBTOPICS = ("playlists/available", "media_queue", "media_queue/delta")
+
+
+def _parse_playlists(payload: Any) -> list[dict[str, Any]]:
+    """Return the valid playlists of a decoded playlists/available payload."""
+    if not isinstance(payload, dict):
+        raise ValueError("not an object")
+    return valid_entries(PLAYLIST_SCHEMA, payload.get("playlists", []), "playlist")
+
+
+def _parse_media_queue(payload: Any) -> tuple[int | None, MediaQueue]:
+    """Return the sequence number and indexed queue of a media_queue payload."""
+    if not isinstance(payload, dict):
+        raise ValueError("not an object")
+    # Deltas continue from the snapshot's sequence number, if it has one
+    seq = payload.get("seq")
+    if not isinstance(seq, int):
+        seq = None
+    items = valid_entries(QUEUE_ITEM_SCHEMA, payload.get("playlist", []), "media queue")
+    return seq, MediaQueue(items)
+
+
+def entry_device_info(config_entry: ConfigEntry, name: str | None) -> DeviceInfo:
+    """Return the device of a config entry's player and diagnostic sensors."""
+    # Use the selected device's identifier if present, otherwise fallback to our own
+    linked_identifier = config_entry.data.get("linked_device_identifier")
+    if linked_identifier:
+        # linked_identifier is a tuple (domain, id)
+        identifiers = {tuple(linked_identifier)}
+    else:
+        identifiers = {(DOMAIN, config_entry.entry_id)}
+    return DeviceInfo(
+        identifiers=identifiers,
+        name=name or DEVICE_NAME_DEFAULT,
+        manufacturer=DEVICE_MANUFACTURER,
+        model=DEVICE_MODEL,
+        sw_version=DEVICE_SW_VERSION,
+    )
+
+
+class StatusValue(NamedTuple):
+    """A role value ingested from MQTT, shaped like the State fields we read."""
+
+    state: str | None
+    attributes: Mapping[str, Any]
+    last_updated: datetime
+
+
+def _parse_status_payload(payload: str | bytes) -> str | None:
+    """Return the value of a status payload, plain or {"value": ...} JSON."""
+    if isinstance(payload, bytes):
+        payload = payload.decode("utf-8", errors="replace")
+    payload = payload.strip()
+    if payload.startswith("{"):
+        try:
+            payload = json.loads(payload).get("value")
+        except (ValueError, AttributeError):
+            return None
+    if payload is None:
+        return None
+    if isinstance(payload, bool):
+        return STATE_ON if payload else STATE_OFF
+    return str(payload)
+
+
+# Volume presses within this window are merged into a single set_value
+VOLUME_COALESCE_WINDOW = 0.25
+# Drop the optimistic volume if the entity has not reported it back by then
+VOLUME_RECONCILE_TIMEOUT = 3.0
+# Drop the optimistic seek position if no report lands near it by then
+SEEK_RECONCILE_TIMEOUT = 3.0
+# Minimum seconds between media queue snapshot requests after a delta gap
+QUEUE_RESYNC_INTERVAL = 5.0
+
+# Attribute refreshers run when the entity linked to a role changes.
+# Title, artist and position also feed _has_active_media, so they re-derive
+# the player state as well.
+ROLE_REFRESHERS: dict[str, tuple[str, ...]] = {
+    CONF_POWER_ENTITY: ("_refresh_player_state",),
+    CONF_PLAYER_STATE_ENTITY: ("_refresh_player_state",),
+    CONF_VOLUME_ENTITY: ("_refresh_volume",),
+    CONF_MUTE_ENTITY: ("_refresh_mute",),
+    CONF_SOURCE_ENTITY: ("_refresh_source", "_refresh_source_list"),
+    CONF_SOURCE_LIST_ENTITY: ("_refresh_source_list",),
+    CONF_MEDIA_TITLE_ENTITY: ("_refresh_media_text", "_refresh_player_state"),
+    CONF_MEDIA_ARTIST_ENTITY: ("_refresh_media_text", "_refresh_player_state"),
+    CONF_MEDIA_ALBUM_ENTITY: ("_refresh_media_text",),
+    CONF_MEDIA_IMAGE_ENTITY: ("_refresh_media_image",),
+    CONF_MEDIA_POSITION_ENTITY: ("_refresh_media_position", "_refresh_player_state"),
+    CONF_MEDIA_DURATION_ENTITY: ("_refresh_media_duration",),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -100,7 +274,10 @@ async def async_setup_entry(
 ) -> None:
     """Set up the CC Player media player from a config entry."""
     name = config_entry.data.get(CONF_NAME, DEFAULT_NAME)
-    async_add_entities([CCPlayerMediaPlayer(hass, config_entry, name)], True)
+    player = CCPlayerMediaPlayer(hass, config_entry, name)
+    hub: CCPlayerHub = hass.data[DOMAIN]
+    hub.players[config_entry.entry_id] = player
+    async_add_entities([player], True)
 
 
 class CCPlayerMediaPlayer(MediaPlayerEntity):
@@ -108,6 +285,16 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
 
     _attr_has_entity_name = True
     _attr_device_class = MediaPlayerDeviceClass.RECEIVER
+    # Duplicates of the standard media attributes, kept for templates only
+    _unrecorded_attributes = frozenset(
+        {
+            "media_title",
+            "media_artist",
+            "media_album",
+            "media_duration",
+            "media_position",
+        }
+    )
 
     def __init__(
         self, hass: HomeAssistant, config_entry: ConfigEntry, name: str
@@ -132,15 +319,71 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         self._attr_media_position_updated_at = None
         self._device_id = config_entry.data.get("device_id")  # Use device_id from config
 
-        # Entity references and actions
+        # Entity references, last known state per role, and actions
         self._entity_refs = {}
+        self._linked_states: dict[str, State | StatusValue | None] = {}
+        # Roles fed straight from yan/<device_id>/status/ instead of entities
+        self._mqtt_roles: frozenset[str] = frozenset()
         self._actions = {}
-        self._unsubscribe_callbacks = []
+        self._action_plans: dict[str, tuple[ActionPlan, ...]] = {}
+        # Topic per command when the direct MQTT backend is active
+        self._command_topics: dict[str, str] = {}
+        self._entity_roles: dict[str, set[str]] = {}
+        self._state_listener_unsub: CALLBACK_TYPE | None = None
 
         # Playlists from MQTT
-        self._playlists = []  # Store playlists from MQTT
-        self._mqtt_unsub = None  # MQTT unsubscribe handle
-        self._mediaqueue = []  # Store mediaqueue playlist from MQTT
+        self._playlists = PlaylistCache(hass)  # Playlists from MQTT
+        self._mqtt_unsubs: list[CALLBACK_TYPE] = []  # MQTT unsubscribe handles
+        self._mediaqueue = MediaQueue()  # Indexed media queue from MQTT
+        # Sequence number of the last snapshot or delta applied to the queue
+        self._mediaqueue_seq: int | None = None
+        self._mediaqueue_resync_at: float | None = None
+        # Payloads larger than this are dropped without decoding
+        self._max_payload_size = DEFAULT_MAX_PAYLOAD_SIZE * 1024
+        # Latest payload received per kind, to drop superseded decodes
+        self._payload_generations: dict[str, int] = {}
+
+        # Browse nodes built on first browse, keyed by media content id, and
+        # the content hash of the payload each root directory was built from
+        self._browse_nodes: dict[str, BrowseMedia] = {}
+        self._browse_hashes: dict[str, int] = {}
+        # Thumbnail URLs in the nodes carry the rotating image proxy token
+        self._browse_token: str | None = None
+
+        # Position extrapolation: rely on the frontend to advance the position
+        # and only re-anchor it on discontinuities
+        self._position_extrapolation = DEFAULT_POSITION_EXTRAPOLATION
+        self._position_drift_tolerance = DEFAULT_POSITION_DRIFT_TOLERANCE
+
+        # Optimistic volume target (in the volume entity's range) while a
+        # coalesced set_value is pending or awaiting confirmation
+        self._volume_target: float | None = None
+        self._volume_flush_unsub: CALLBACK_TYPE | None = None
+        self._volume_reconcile_unsub: CALLBACK_TYPE | None = None
+
+        # Optimistic transport state held until the state sensor reports or
+        # the reconciliation window expires, with prediction accuracy stats
+        self._optimistic_transport = DEFAULT_OPTIMISTIC_TRANSPORT
+        self._optimistic_window = DEFAULT_OPTIMISTIC_WINDOW
+        self._optimistic_state: MediaPlayerState | None = None
+        self._optimistic_since: datetime | None = None
+        self._optimistic_unsub: CALLBACK_TYPE | None = None
+        self._optimistic_stats = {"predictions": 0, "confirmed": 0, "mispredicted": 0}
+
+        # Seek scheduler: the most recent target waiting for the in-flight seek
+        self._seek_target: float | None = None
+        self._seek_in_flight = False
+        # Optimistic seek position held until a report lands near it, as
+        # reports sent before the device applied the seek arrive later
+        self._seek_position: float | None = None
+        self._seek_reconcile_unsub: CALLBACK_TYPE | None = None
+
+        # Last state written to the state machine, used to skip no-op writes
+        self._last_written_snapshot: tuple | None = None
+
+        # Work done by this player, exposed as diagnostic sensors
+        hub: CCPlayerHub = hass.data[DOMAIN]
+        self._counters = hub.counters_for(config_entry.entry_id)
 
         # Set up initial entities from config
         self._setup_from_config()
@@ -150,31 +393,31 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         await super().async_added_to_hass()
 
         # Set up state change listeners
-        await self._setup_listeners()
+        self._setup_listeners()
 
         # Initial refresh
-        await self._refresh_states()
+        self._refresh_states()
 
         # Subscribe to config changes
         self._config_entry.add_update_listener(self._handle_config_update)
 
-        # Subscribe to MQTT playlists topic
-        await self._subscribe_playlists_mqtt()
-        await self._subscribe_mediaqueue_mqtt()  # <-- add this line
+        # Subscribe to the device's MQTT status topics
+        await self._async_subscribe_mqtt()
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when entity is removed from hass."""
-        for unsub in self._unsubscribe_callbacks:
-            unsub()
-        self._unsubscribe_callbacks = []
+        if self._state_listener_unsub:
+            self._state_listener_unsub()
+            self._state_listener_unsub = None
+
+        self._cancel_volume_timers()
+        self._cancel_seek_reconcile()
+        if self._optimistic_unsub:
+            self._optimistic_unsub()
+            self._optimistic_unsub = None
 
         # Unsubscribe from MQTT
-        if self._mqtt_unsub:
-            self._mqtt_unsub()
-            self._mqtt_unsub = None
-        if hasattr(self, "_mediaqueue_mqtt_unsub") and self._mediaqueue_mqtt_unsub:
-            self._mediaqueue_mqtt_unsub()
-            self._mediaqueue_mqtt_unsub = None
+        self._unsubscribe_mqtt()
 
     @callback
     def _setup_from_config(self) -> None:
@@ -198,6 +441,40 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
             CONF_MEDIA_DURATION_ENTITY: options.get(CONF_MEDIA_DURATION_ENTITY),
         }
 
+        self._position_extrapolation = options.get(
+            CONF_POSITION_EXTRAPOLATION, DEFAULT_POSITION_EXTRAPOLATION
+        )
+        self._position_drift_tolerance = options.get(
+            CONF_POSITION_DRIFT_TOLERANCE, DEFAULT_POSITION_DRIFT_TOLERANCE
+        )
+
+        self._optimistic_transport = options.get(
+            CONF_OPTIMISTIC_TRANSPORT, DEFAULT_OPTIMISTIC_TRANSPORT
+        )
+        self._optimistic_window = options.get(
+            CONF_OPTIMISTIC_WINDOW, DEFAULT_OPTIMISTIC_WINDOW
+        )
+
+        self._max_payload_size = int(
+            options.get(CONF_MAX_PAYLOAD_SIZE, DEFAULT_MAX_PAYLOAD_SIZE) * 1024
+        )
+
+        # Direct MQTT commands need a YAN device id; other setups use actions
+        self._command_topics = {}
+        if self._device_id and options.get(
+            CONF_DIRECT_MQTT_COMMANDS, DEFAULT_DIRECT_MQTT_COMMANDS
+        ):
+            self._command_topics = {
+                command: f"yan/{self._device_id}/command/{command}"
+                for command in YAN_COMMANDS
+            }
+
+        self._mqtt_roles = frozenset()
+        if self._device_id and options.get(
+            CONF_STATE_FROM_MQTT, DEFAULT_STATE_FROM_MQTT
+        ):
+            self._mqtt_roles = frozenset(YAN_STATUS_ROLES.values())
+
         # Store action configurations - handle both old and new format
         actions_config = options.get(CONF_ACTIONS, {})
         self._actions = {}
@@ -231,98 +508,287 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
                     "Loaded legacy action %s: %s", action_key, options[action_key]
                 )
 
+        # Validate and compile templates once, not on every call
+        self._action_plans = {
+            action_key: compile_action_list(self.hass, action_key, actions_list)
+            for action_key, actions_list in self._actions.items()
+        }
+
         _LOGGER.debug("Total actions loaded: %s", list(self._actions.keys()))
         _LOGGER.debug("Actions dict: %s", self._actions)
 
         # Determine supported features based on configured entities and actions
         self._update_supported_features()
 
-    async def _subscribe_playlists_mqtt(self):
-        """Subscribe to the MQTT playlists/available topic."""
-        base_topic = self._device_id or "ccplayer"
-        playlists_topic = f"yan/{base_topic}/status/playlists/available"
-        _LOGGER.debug("Subscribing to MQTT playlists topic: %s", playlists_topic)
-        print(f"DEBUG: Subscribing to MQTT playlists topic: {playlists_topic}")
+    async def _async_subscribe_mqtt(self) -> None:
+        """Receive this device's status messages through the shared hub."""
+        hub: CCPlayerHub = self.hass.data[DOMAIN]
+        # Position ticks and the like only when state is ingested from MQTT
+        subtopics = set(YAN_SNAPSHOT_SUBTOPICS)
+        subtopics.update(
+            subtopic
+            for subtopic, role in YAN_STATUS_ROLES.items()
+            if role in self._mqtt_roles
+        )
+        self._mqtt_unsubs.append(
+            await hub.async_register(
+                self._device_id or "ccplayer", self._handle_status_message, subtopics
+            )
+        )
 
-        @callback
-        def handle_mqtt_message(msg):
-            try:
-                payload = json.loads(msg.payload)
-                self._playlists = payload.get("playlists", [])
-                self.async_write_ha_state()
-            except Exception as ex:
-                _LOGGER.error("Failed to parse playlists MQTT payload: %s", ex)
-                print(f"DEBUG: Failed to parse playlists MQTT payload: {ex}")
+    @callback
+    def _unsubscribe_mqtt(self) -> None:
+        """Drop all MQTT subscriptions of this player."""
+        for unsub in self._mqtt_unsubs:
+            unsub()
+        self._mqtt_unsubs = []
 
-        self._mqtt_unsub = await mqtt.async_subscribe(
-            self.hass, playlists_topic, handle_mqtt_message, 1
+    @callback
+    def _handle_status_message(self, subtopic: str, msg: mqtt.ReceiveMessage) -> None:
+        """Dispatch a message from yan/<device_id>/status/ by subtopic."""
+        if subtopic == "playlists/available":
+            self._handle_playlists_message(msg)
+        elif subtopic == "media_queue":
+            self._handle_mediaqueue_message(msg)
+        elif subtopic == "media_queue/delta":
+            self._handle_mediaqueue_delta_message(msg)
+        elif (role := YAN_STATUS_ROLES.get(subtopic)) in self._mqtt_roles:
+            self._handle_status_value(role, msg.payload)
+        else:
+            # Subtopics this player ignores are not its work
+            return
+
+        payload = msg.payload
+        self._counters.mqtt_messages += 1
+        self._counters.mqtt_bytes += len(
+            payload.encode() if isinstance(payload, str) else payload
         )
-        _LOGGER.debug("MQTT subscription set up for: %s", playlists_topic)
-        print(f"DEBUG: MQTT subscription set up for: {playlists_topic}")
 
-    async def _subscribe_mediaqueue_mqtt(self):
-        """Subscribe to the MQTT mediaqueue topic for sources."""
-        base_topic = self._device_id or "ccplayer"
-        mediaqueue_topic = f"yan/{base_topic}/status/media_queue"
-        _LOGGER.debug("Subscribing to MQTT mediaqueue topic: %s", mediaqueue_topic)
-        print(f"DEBUG: Subscribing to MQTT mediaqueue topic: {mediaqueue_topic}")
+    @callback
+    def _decode_payload(
+        self,
+        kind: str,
+        payload: str | bytes,
+        apply: Callable[[Any], None],
+        parse: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Decode a JSON payload, parse it and pass the result to apply.
+
+        parse must not touch the player: for large payloads decoding and
+        parsing run together in the executor, and only apply runs in the
+        event loop. parse raises ValueError to reject the payload. If another
+        payload of the same kind arrives meanwhile, the older one is dropped
+        when its decode finishes, so payloads never apply out of order.
+        """
+        generation = self._payload_generations.get(kind, 0) + 1
+        self._payload_generations[kind] = generation
+
+        # The limit is in bytes, HA hands payloads over as str
+        size = len(payload.encode() if isinstance(payload, str) else payload)
+        if size > self._max_payload_size:
+            _LOGGER.warning(
+                "Ignoring %s MQTT payload of %d bytes, the maximum is %d",
+                kind,
+                size,
+                self._max_payload_size,
+            )
+            return
 
-        @callback
-        def handle_mediaqueue_message(msg):
+        def decode() -> Any:
+            data = json.loads(payload)
+            return parse(data) if parse is not None else data
 
+        if size < DECODE_EXECUTOR_THRESHOLD:
             try:
-                payload = json.loads(msg.payload)
-                self._mediaqueue = payload.get("playlist", [])
-                self.async_write_ha_state()
-            except Exception as ex:
-                _LOGGER.error("Failed to parse mediaqueue MQTT payload: %s", ex)
-                print(f"DEBUG: Failed to parse mediaqueue MQTT payload: {ex}")
+                data = decode()
+            except ValueError as ex:
+                _LOGGER.error("Failed to parse %s MQTT payload: %s", kind, ex)
+                return
+            apply(data)
+            return
+
+        async def _async_decode() -> None:
+            try:
+                data = await self.hass.async_add_executor_job(decode)
+            except ValueError as ex:
+                _LOGGER.error("Failed to parse %s MQTT payload: %s", kind, ex)
+                return
+            if self._payload_generations.get(kind) != generation:
+                _LOGGER.debug("Dropping superseded %s MQTT payload", kind)
+                return
+            apply(data)
+
+        self.hass.async_create_task(_async_decode())
+
+    @callback
+    def _handle_playlists_message(self, msg: mqtt.ReceiveMessage) -> None:
+        """Store the playlists published on playlists/available."""
+        content_hash = hash(msg.payload)
+        if content_hash == self._browse_hashes.get(PLAYLISTS_NODE_ID):
+            # Same playlists again: only refresh the cache's freshness
+            self._playlists.async_set(self._playlists.playlists)
+            return
 
-        self._mediaqueue_mqtt_unsub = await mqtt.async_subscribe(
-            self.hass, mediaqueue_topic, handle_mediaqueue_message, 1
+        @callback
+        def apply(playlists: list[dict[str, Any]]) -> None:
+            self._playlists.async_set(playlists)
+            self._browse_hashes[PLAYLISTS_NODE_ID] = content_hash
+            self._invalidate_browse_nodes(PLAYLISTS_NODE_ID)
+
+        self._decode_payload("playlists", msg.payload, apply, _parse_playlists)
+
+    @callback
+    def _handle_mediaqueue_message(self, msg: mqtt.ReceiveMessage) -> None:
+        """Store the media queue snapshot published on media_queue."""
+        self._mediaqueue_resync_at = None
+        content_hash = hash(msg.payload)
+        if content_hash == self._browse_hashes.get(SOURCES_NODE_ID):
+            return
+
+        @callback
+        def apply(snapshot: tuple[int | None, MediaQueue]) -> None:
+            seq, queue = snapshot
+            if (
+                seq is not None
+                and self._mediaqueue_seq is not None
+                and seq < self._mediaqueue_seq
+            ):
+                # Deltas newer than this snapshot were applied while it decoded
+                _LOGGER.debug("Ignoring media queue snapshot %s, older than queue", seq)
+                return
+
+            self._mediaqueue = queue
+            self._mediaqueue_seq = seq
+            self._browse_hashes[SOURCES_NODE_ID] = content_hash
+            self._invalidate_browse_nodes(SOURCES_NODE_ID)
+
+        self._decode_payload("media_queue", msg.payload, apply, _parse_media_queue)
+
+    @callback
+    def _handle_mediaqueue_delta_message(self, msg: mqtt.ReceiveMessage) -> None:
+        """Apply the queue changes published on media_queue/delta."""
+        self._decode_payload(
+            "media_queue/delta", msg.payload, self._apply_mediaqueue_delta
         )
-        _LOGGER.debug("MQTT subscription set up for: %s", mediaqueue_topic)
-        print(f"DEBUG: MQTT subscription set up for: {mediaqueue_topic}")
 
-    async def _setup_listeners(self) -> None:
-        """Set up state change listeners for tracked entities."""
-        # Clear any existing listeners
-        for unsub in self._unsubscribe_callbacks:
-            unsub()
-        self._unsubscribe_callbacks = []
+    @callback
+    def _apply_mediaqueue_delta(self, payload: Any) -> None:
+        """Apply a decoded media queue delta, or resync on a gap."""
+        try:
+            seq = payload["seq"]
+            ops = payload["ops"]
+        except (TypeError, KeyError) as ex:
+            _LOGGER.error("Invalid mediaqueue delta MQTT payload: %s", ex)
+            return
 
-        # Add listeners for each configured entity
-        for entity_id in [entity for entity in self._entity_refs.values() if entity]:
-            unsub = async_track_state_change_event(
-                self.hass, [entity_id], self._handle_state_changed
+        if self._mediaqueue_seq is not None and isinstance(seq, int):
+            if seq <= self._mediaqueue_seq:
+                # Redelivered or older than the snapshot we hold
+                return
+            if seq == self._mediaqueue_seq + 1:
+                try:
+                    self._mediaqueue = self._mediaqueue.apply_delta(ops)
+                except (ValueError, TypeError) as ex:
+                    _LOGGER.debug("Media queue delta %s does not apply: %s", seq, ex)
+                else:
+                    self._mediaqueue_seq = seq
+                    # The last snapshot no longer describes the queue
+                    self._browse_hashes.pop(SOURCES_NODE_ID, None)
+                    self._invalidate_browse_nodes(SOURCES_NODE_ID)
+                    return
+
+        # Missed a delta, or no snapshot to apply it to: ask for a snapshot,
+        # at most once per interval while waiting for it
+        now = self.hass.loop.time()
+        if (
+            self._mediaqueue_resync_at is None
+            or now - self._mediaqueue_resync_at >= QUEUE_RESYNC_INTERVAL
+        ):
+            _LOGGER.debug(
+                "Media queue delta %s after %s, requesting a snapshot",
+                seq,
+                self._mediaqueue_seq,
             )
-            self._unsubscribe_callbacks.append(unsub)
+            self._mediaqueue_resync_at = now
+            self._mediaqueue_seq = None
+            # Take the snapshot even if it repeats the last one we parsed
+            self._browse_hashes.pop(SOURCES_NODE_ID, None)
+            self.hass.async_create_task(self._async_request_queue())
 
-    def _get_entity_state_value(self, entity_id: str, default=None):
-        """Get entity state value, handling common invalid states."""
-        if not entity_id:
-            return default
+    @callback
+    def _handle_status_value(self, role: str, payload: str | bytes) -> None:
+        """Ingest a player state value published straight by the device."""
+        value = _parse_status_payload(payload)
+        if value is not None and role in (CONF_POWER_ENTITY, CONF_MUTE_ENTITY):
+            value = STATE_ON if value.lower() in ("on", "true", "1") else STATE_OFF
+
+        previous = self._linked_states.get(role)
+        if previous is not None and previous.state == value:
+            return
 
-        state = self.hass.states.get(entity_id)
+        # Keep the linked entity's attributes (e.g. volume min/max) if any
+        attributes = {}
+        if (entity_id := self._entity_refs.get(role)) and (
+            entity_state := self.hass.states.get(entity_id)
+        ):
+            attributes = entity_state.attributes
+
+        self._linked_states[role] = StatusValue(value, attributes, util.dt.utcnow())
+        self._refresh_roles((role,))
+        self._async_write_ha_state_if_changed()
+
+    @callback
+    def _setup_listeners(self) -> None:
+        """Track all linked entities with a single state change subscription."""
+        # Reverse index: one entity may feed several roles. Roles ingested
+        # from MQTT status topics do not need their entity tracked.
+        entity_roles: dict[str, set[str]] = {}
+        for role, entity_id in self._entity_refs.items():
+            if entity_id and role not in self._mqtt_roles:
+                entity_roles.setdefault(entity_id, set()).add(role)
+
+        tracked_changed = entity_roles.keys() != self._entity_roles.keys()
+        self._entity_roles = entity_roles
+
+        # Role changes on already tracked entities only need the new index
+        if self._state_listener_unsub and not tracked_changed:
+            return
+
+        if self._state_listener_unsub:
+            self._state_listener_unsub()
+            self._state_listener_unsub = None
+
+        if entity_roles:
+            self._state_listener_unsub = async_track_state_change_event(
+                self.hass, list(entity_roles), self._handle_state_changed
+            )
+
+    def _get_entity_state_value(self, role: str, default=None):
+        """Get the linked entity state value for a role, handling invalid states."""
+        state = self._linked_states.get(role)
         if not state or state.state in (None, "unknown", "unavailable", ""):
             return default
         return state.state
 
-    def _get_numeric_state_value(self, entity_id: str, default=None):
-        """Get numeric entity state value with error handling."""
-        value = self._get_entity_state_value(entity_id)
+    def _get_numeric_state_value(self, role: str, default=None):
+        """Get numeric linked entity state value with error handling."""
+        value = self._get_entity_state_value(role)
         if value is None:
             return default
 
         try:
             return float(value)
         except (ValueError, TypeError):
-            _LOGGER.warning("Could not convert %s state to float: %s", entity_id, value)
+            _LOGGER.warning(
+                "Could not convert %s state to float: %s",
+                self._entity_refs.get(role),
+                value,
+            )
             return default
 
-    def _parse_list_from_state(self, entity_id: str, default=None):
-        """Parse a list from entity state (JSON or comma-separated)."""
-        value = self._get_entity_state_value(entity_id)
+    def _parse_list_from_state(self, role: str, default=None):
+        """Parse a list from linked entity state (JSON or comma-separated)."""
+        value = self._get_entity_state_value(role)
         if not value:
             return default
 
@@ -334,13 +800,12 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
 
     def _get_volume_range(self) -> tuple[float, float]:
         """Get volume entity's min and max values from its attributes."""
-        volume_entity = self._entity_refs.get(CONF_VOLUME_ENTITY)
-        if not volume_entity:
-            return 0.0, 1.0  # Default range
-
-        state = self.hass.states.get(volume_entity)
+        state = self._linked_states.get(CONF_VOLUME_ENTITY)
         if not state:
-            return 0.0, 1.0
+            return 0.0, 1.0  # Default range
+        if isinstance(state, StatusValue) and not state.attributes:
+            # From MQTT without a linked entity to take the range from
+            return YAN_VOLUME_RANGE
 
         # Try to get min/max from entity attributes
         min_value = state.attributes.get("min", 0.0)
@@ -350,7 +815,8 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
             return float(min_value), float(max_value)
         except (ValueError, TypeError):
             _LOGGER.warning(
-                "Could not parse volume range for %s, using defaults", volume_entity
+                "Could not parse volume range for %s, using defaults",
+                self._entity_refs.get(CONF_VOLUME_ENTITY),
             )
             return 0.0, 1.0
 
@@ -364,16 +830,153 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         min_val, max_val = self._get_volume_range()
         if max_val == min_val:
             return 0.0
-        return (entity_value - min_val) / (max_val - min_val)
+        level = (entity_value - min_val) / (max_val - min_val)
+        return max(0.0, min(1.0, level))
+
+    @callback
+    def _refresh_states(self) -> None:
+        """Re-read every linked entity and refresh all attributes."""
+        started = time.perf_counter()
+        self._linked_states = {
+            role: self._read_linked_state(role)
+            for role in self._entity_refs
+        }
 
-    async def _refresh_states(self) -> None:
-        """Refresh all entity states."""
-        current_state = self._determine_player_state()
+        for refresher in (
+            self._refresh_volume,
+            self._refresh_mute,
+            self._refresh_source,
+            self._refresh_source_list,
+            self._refresh_media_info,
+            self._refresh_player_state,
+        ):
+            refresher()
+
+        self._counters.record_refresh(time.perf_counter() - started, full=True)
+        self._async_write_ha_state_if_changed()
+
+    def _read_linked_state(self, role: str) -> State | StatusValue | None:
+        """Return the current state feeding a role."""
+        if role in self._mqtt_roles:
+            # Values from MQTT are only replaced by newer MQTT messages
+            return self._linked_states.get(role)
+        if entity_id := self._entity_refs.get(role):
+            return self.hass.states.get(entity_id)
+        return None
 
-        # Volume - use dynamic range from entity
-        volume_value = self._get_numeric_state_value(
-            self._entity_refs.get(CONF_VOLUME_ENTITY)
+    @callback
+    def _async_write_ha_state_if_changed(self) -> None:
+        """Write state only when the exposed state or attributes changed."""
+        snapshot = (
+            self.state,
+            self.available,
+            self.supported_features,
+            self.device_class,
+            self.entity_picture,
+            self.capability_attributes,
+            self.state_attributes,
+            self.extra_state_attributes,
         )
+        if snapshot == self._last_written_snapshot:
+            self._counters.state_writes_suppressed += 1
+            return
+
+        self._last_written_snapshot = snapshot
+        self._counters.state_writes += 1
+        self.async_write_ha_state()
+
+    @callback
+    def _refresh_player_state(self) -> None:
+        """Refresh the player state from the state and power entities."""
+        state = self._determine_player_state()
+        if self._optimistic_state is not None:
+            # Hold the prediction until the state or power entity reports
+            if not self._player_state_reported_since(self._optimistic_since):
+                return
+            self._resolve_optimistic_state(state)
+        self._set_player_state(state)
+
+    @callback
+    def _set_player_state(self, state: MediaPlayerState | None) -> None:
+        """Set the player state, re-anchoring the position on transitions."""
+        # Pause/resume changes the extrapolation rate, so re-anchor
+        if self._position_extrapolation and state != self._attr_state:
+            self._anchor_media_position()
+        self._attr_state = state
+
+    def _player_state_reported_since(self, since: datetime | None) -> bool:
+        """Return True if a state-feeding entity was updated after since."""
+        for role in (CONF_PLAYER_STATE_ENTITY, CONF_POWER_ENTITY):
+            state = self._linked_states.get(role)
+            if state is not None and since is not None and state.last_updated >= since:
+                return True
+        return False
+
+    @callback
+    def _async_set_optimistic_state(self, state: MediaPlayerState) -> None:
+        """Show the expected state at once and open the reconciliation window."""
+        if not self._optimistic_transport:
+            return
+
+        self._optimistic_stats["predictions"] += 1
+        self._optimistic_state = state
+        self._optimistic_since = util.dt.utcnow()
+        if self._optimistic_unsub:
+            self._optimistic_unsub()
+        self._optimistic_unsub = async_call_later(
+            self.hass, self._optimistic_window, self._async_optimistic_expired
+        )
+
+        self._set_player_state(state)
+        self._async_write_ha_state_if_changed()
+
+    @callback
+    def _resolve_optimistic_state(self, observed: MediaPlayerState | None) -> None:
+        """Score the pending prediction against the observed state and drop it."""
+        if observed == self._optimistic_state:
+            self._optimistic_stats["confirmed"] += 1
+        else:
+            self._optimistic_stats["mispredicted"] += 1
+            _LOGGER.debug(
+                "Optimistic state %s for %s did not match observed %s",
+                self._optimistic_state,
+                self.entity_id,
+                observed,
+            )
+
+        self._optimistic_state = None
+        self._optimistic_since = None
+        if self._optimistic_unsub:
+            self._optimistic_unsub()
+            self._optimistic_unsub = None
+
+    @callback
+    def _async_optimistic_expired(self, _now: datetime) -> None:
+        """Fall back to the observed state when the window expires."""
+        self._optimistic_unsub = None
+        if self._optimistic_state is None:
+            return
+
+        state = self._determine_player_state()
+        self._resolve_optimistic_state(state)
+        self._set_player_state(state)
+        self._async_write_ha_state_if_changed()
+
+    @callback
+    def _refresh_volume(self) -> None:
+        """Refresh volume level using the volume entity's dynamic range."""
+        volume_value = self._get_numeric_state_value(CONF_VOLUME_ENTITY)
+        if self._volume_target is not None:
+            # Keep the optimistic level until the entity reports the target
+            if (
+                self._volume_flush_unsub is not None
+                or volume_value is None
+                or abs(volume_value - self._volume_target) > self._volume_step() / 2
+            ):
+                return
+            self._volume_target = None
+            self._cancel_volume_timers()
+
         if volume_value is not None:
             self._attr_volume_level = self._normalize_volume_from_entity_range(
                 volume_value
@@ -381,42 +984,36 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         else:
             self._attr_volume_level = None
 
-        # Mute
-        mute_state = self._get_entity_state_value(
-            self._entity_refs.get(CONF_MUTE_ENTITY)
-        )
+    @callback
+    def _refresh_mute(self) -> None:
+        """Refresh mute state."""
+        mute_state = self._get_entity_state_value(CONF_MUTE_ENTITY)
         self._attr_is_volume_muted = mute_state == STATE_ON if mute_state else None
 
-        # Source
-        self._attr_source = self._get_entity_state_value(
-            self._entity_refs.get(CONF_SOURCE_ENTITY)
-        )
+    @callback
+    def _refresh_source(self) -> None:
+        """Refresh the selected source."""
+        self._attr_source = self._get_entity_state_value(CONF_SOURCE_ENTITY)
 
-        # Source list from source entity attributes or separate entity
-        source_entity = self._entity_refs.get(CONF_SOURCE_ENTITY)
-        if source_entity:
-            state = self.hass.states.get(source_entity)
-            if state and "options" in state.attributes:
-                self._attr_source_list = state.attributes["options"]
-
-        if not self._attr_source_list:
-            self._attr_source_list = self._parse_list_from_state(
-                self._entity_refs.get(CONF_SOURCE_LIST_ENTITY)
-            )
+    @callback
+    def _refresh_source_list(self) -> None:
+        """Refresh source list from source entity attributes or separate entity."""
+        state = self._linked_states.get(CONF_SOURCE_ENTITY)
+        if state and "options" in state.attributes:
+            self._attr_source_list = state.attributes["options"]
+            return
 
-        # Media info
-        self._refresh_media_info()
+        self._attr_source_list = self._parse_list_from_state(CONF_SOURCE_LIST_ENTITY)
 
-        # Update final state
-        self._attr_state = current_state
-        self.async_write_ha_state()
+    def _has_role(self, role: str) -> bool:
+        """Return True if the role is fed by a linked entity or by MQTT."""
+        return role in self._mqtt_roles or bool(self._entity_refs.get(role))
 
     def _determine_player_state(self) -> MediaPlayerState | None:
         """Determine player state from configured entities."""
         # Try player state entity first
-        player_state_entity = self._entity_refs.get(CONF_PLAYER_STATE_ENTITY)
-        if player_state_entity:
-            state_value = self._get_entity_state_value(player_state_entity)
+        if self._has_role(CONF_PLAYER_STATE_ENTITY):
+            state_value = self._get_entity_state_value(CONF_PLAYER_STATE_ENTITY)
             if state_value:
                 mapped_state = PLAYER_STATE_MAP.get(state_value.lower())
                 if mapped_state:
@@ -428,9 +1025,8 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
                 return MediaPlayerState.IDLE
 
         # Fallback to power entity
-        power_entity = self._entity_refs.get(CONF_POWER_ENTITY)
-        if power_entity:
-            power_state = self._get_entity_state_value(power_entity)
+        if self._has_role(CONF_POWER_ENTITY):
+            power_state = self._get_entity_state_value(CONF_POWER_ENTITY)
             if power_state == STATE_ON:
                 return (
                     MediaPlayerState.PLAYING
@@ -442,50 +1038,129 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
 
         return None
 
+    @callback
     def _refresh_media_info(self) -> None:
         """Refresh media information from configured entities."""
-        # Text media info
-        media_fields = [
-            ("_attr_media_title", CONF_MEDIA_TITLE_ENTITY),
-            ("_attr_media_artist", CONF_MEDIA_ARTIST_ENTITY),
-            ("_attr_media_album_name", CONF_MEDIA_ALBUM_ENTITY),
-        ]
-
-        for attr_name, entity_key in media_fields:
-            entity_id = self._entity_refs.get(entity_key)
-            value = self._get_entity_state_value(entity_id)
-            setattr(self, attr_name, value)
+        self._refresh_media_text()
+        self._refresh_media_duration()
+        self._refresh_media_position()
+        self._refresh_media_image()
 
-        # Media duration (convert from milliseconds)
-        duration_ms = self._get_numeric_state_value(
-            self._entity_refs.get(CONF_MEDIA_DURATION_ENTITY)
+    @callback
+    def _refresh_media_text(self) -> None:
+        """Refresh title, artist and album."""
+        title = self._get_entity_state_value(CONF_MEDIA_TITLE_ENTITY)
+        # A track change is a position discontinuity
+        if self._position_extrapolation and title != self._attr_media_title:
+            self._anchor_media_position()
+        self._attr_media_title = title
+        self._attr_media_artist = self._get_entity_state_value(
+            CONF_MEDIA_ARTIST_ENTITY
+        )
+        self._attr_media_album_name = self._get_entity_state_value(
+            CONF_MEDIA_ALBUM_ENTITY
         )
+
+    @callback
+    def _refresh_media_duration(self) -> None:
+        """Refresh media duration (converted from milliseconds)."""
+        duration_ms = self._get_numeric_state_value(CONF_MEDIA_DURATION_ENTITY)
         self._attr_media_duration = (
             duration_ms / 1000 if duration_ms is not None else None
         )
 
-        # Media position with timestamp tracking
-        position_ms = self._get_numeric_state_value(
-            self._entity_refs.get(CONF_MEDIA_POSITION_ENTITY)
-        )
-        if position_ms is not None:
-            self._attr_media_position = position_ms / 1000
-            self._attr_media_position_updated_at = util.dt.utcnow()
-        else:
+    @callback
+    def _refresh_media_position(self) -> None:
+        """Refresh media position with timestamp tracking."""
+        position_ms = self._get_numeric_state_value(CONF_MEDIA_POSITION_ENTITY)
+        if self._seek_position is not None:
+            # Reports from before the seek landed would make the UI bounce back
+            expected = self._extrapolated_media_position()
+            if (
+                self._seek_in_flight
+                or position_ms is None
+                or expected is None
+                or abs(position_ms / 1000 - expected)
+                > self._position_drift_tolerance
+            ):
+                return
+            self._seek_position = None
+            self._cancel_seek_reconcile()
+
+        if position_ms is None:
             self._attr_media_position = None
             self._attr_media_position_updated_at = None
+            return
 
-        # Media image
-        self._refresh_media_image()
+        position = position_ms / 1000
+        if self._position_extrapolation:
+            # Accept ticks silently while they track the extrapolated value
+            expected = self._extrapolated_media_position()
+            if (
+                expected is not None
+                and abs(position - expected) <= self._position_drift_tolerance
+            ):
+                return
+        elif position == self._attr_media_position:
+            return
 
-    def _refresh_media_image(self) -> None:
-        """Refresh media image from image entity."""
-        image_entity = self._entity_refs.get(CONF_MEDIA_IMAGE_ENTITY)
-        if not image_entity:
-            self._attr_media_image_url = None
+        self._attr_media_position = position
+        self._attr_media_position_updated_at = util.dt.utcnow()
+
+    def _extrapolated_media_position(self) -> float | None:
+        """Return the position the frontend currently extrapolates to."""
+        if (
+            self._attr_media_position is None
+            or self._attr_media_position_updated_at is None
+        ):
+            return None
+        if self._attr_state != MediaPlayerState.PLAYING:
+            return self._attr_media_position
+
+        elapsed = util.dt.utcnow() - self._attr_media_position_updated_at
+        return self._attr_media_position + elapsed.total_seconds()
+
+    @callback
+    def _anchor_media_position(self) -> None:
+        """Re-anchor the position to the last reported value."""
+        if self._seek_position is not None:
+            # Reports are stale until the seek is confirmed, keep its timeline
+            self._attr_media_position = self._extrapolated_media_position()
+            self._attr_media_position_updated_at = util.dt.utcnow()
+            return
+
+        position_ms = self._get_numeric_state_value(CONF_MEDIA_POSITION_ENTITY)
+        if position_ms is None:
             return
+        self._attr_media_position = position_ms / 1000
+        self._attr_media_position_updated_at = util.dt.utcnow()
 
-        state = self.hass.states.get(image_entity)
+    @callback
+    def _async_seek_reconcile_timeout(self, _now: datetime) -> None:
+        """Fall back to the reported position if the seek was never confirmed."""
+        self._seek_reconcile_unsub = None
+        if self._seek_in_flight:
+            # Still sending, wait for the device once the send is done
+            self._seek_reconcile_unsub = async_call_later(
+                self.hass, SEEK_RECONCILE_TIMEOUT, self._async_seek_reconcile_timeout
+            )
+            return
+
+        self._seek_position = None
+        self._anchor_media_position()
+        self._async_write_ha_state_if_changed()
+
+    @callback
+    def _cancel_seek_reconcile(self) -> None:
+        """Cancel the pending seek reconcile timer."""
+        if self._seek_reconcile_unsub:
+            self._seek_reconcile_unsub()
+            self._seek_reconcile_unsub = None
+
+    @callback
+    def _refresh_media_image(self) -> None:
+        """Refresh media image from image entity."""
+        state = self._linked_states.get(CONF_MEDIA_IMAGE_ENTITY)
         if not state:
             self._attr_media_image_url = None
             return
@@ -524,17 +1199,6 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         """Return entity specific state attributes."""
         attrs = {}
 
-        # Always include configured entities for debugging
-        attrs["configured_entities"] = {
-            key: entity_id
-            for key, entity_id in self._entity_refs.items()
-            if entity_id is not None
-        }
-
-        # Include configured actions with full details for debugging
-        attrs["configured_actions"] = self._actions
-        attrs["config_entry_options"] = dict(self._config_entry.options)
-
         # Media info
         if self._attr_media_title:
             attrs["media_title"] = self._attr_media_title
@@ -549,6 +1213,22 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
 
         return attrs
 
+    @callback
+    def diagnostics_data(self) -> dict[str, Any]:
+        """Return runtime data for the diagnostics download."""
+        return {
+            "configured_entities": {
+                key: entity_id
+                for key, entity_id in self._entity_refs.items()
+                if entity_id is not None
+            },
+            "configured_actions": self._actions,
+            "device_id": self._device_id,
+            "optimistic_transport": dict(self._optimistic_stats),
+            "counters": self._counters.diagnostics_data(),
+            "playlists": self._playlists.diagnostics_data(),
+        }
+
     @callback
     def _update_supported_features(self) -> None:
         """Update the supported features based on the configured entities and actions."""
@@ -575,6 +1255,24 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         if self._entity_refs.get(CONF_SOURCE_ENTITY):
             features |= MediaPlayerEntityFeature.SELECT_SOURCE
 
+        # Transport, seek and mute go straight to the device topics
+        if self._command_topics:
+            features |= (
+                MediaPlayerEntityFeature.PLAY
+                | MediaPlayerEntityFeature.PAUSE
+                | MediaPlayerEntityFeature.STOP
+                | MediaPlayerEntityFeature.NEXT_TRACK
+                | MediaPlayerEntityFeature.PREVIOUS_TRACK
+                | MediaPlayerEntityFeature.SEEK
+                | MediaPlayerEntityFeature.VOLUME_MUTE
+            )
+            # Stepping needs the current level, which MQTT ingestion provides
+            if CONF_VOLUME_ENTITY in self._mqtt_roles:
+                features |= (
+                    MediaPlayerEntityFeature.VOLUME_SET
+                    | MediaPlayerEntityFeature.VOLUME_STEP
+                )
+
         # Transport controls based on configured actions
         if self._actions.get(CONF_PLAY_ACTION):
             features |= MediaPlayerEntityFeature.PLAY
@@ -620,47 +1318,61 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
             "Updated supported features: %s, actions: %s", features, self._actions
         )
 
-    async def _handle_state_changed(self, event) -> None:
-        """Handle state changes in tracked entities."""
-        await self._refresh_states()
+    @callback
+    def _handle_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Recompute only the attributes fed by the entity that changed."""
+        self._counters.state_changes += 1
+        roles = self._entity_roles.get(event.data["entity_id"])
+        if not roles:
+            return
+
+        new_state = event.data["new_state"]
+        for role in roles:
+            self._linked_states[role] = new_state
+
+        self._refresh_roles(roles)
+        self._async_write_ha_state_if_changed()
+
+    @callback
+    def _refresh_roles(self, roles: Iterable[str]) -> None:
+        """Run the refreshers fed by the given roles, each at most once."""
+        started = time.perf_counter()
+        refreshers: dict[str, None] = {}
+        for role in roles:
+            refreshers.update(dict.fromkeys(ROLE_REFRESHERS.get(role, ())))
+
+        for refresher in refreshers:
+            getattr(self, refresher)()
+
+        self._counters.record_refresh(time.perf_counter() - started)
 
     async def _handle_config_update(self, hass, config_entry) -> None:
         """Handle configuration updates."""
+        previous_refs = self._entity_refs
+        previous_mqtt_roles = self._mqtt_roles
         self._setup_from_config()
-        await self._setup_listeners()
-        await self._refresh_states()
-
-        # Re-subscribe to MQTT if topic changed
-        if self._mqtt_unsub:
-            self._mqtt_unsub()
-            self._mqtt_unsub = None
-        await self._subscribe_playlists_mqtt()
-        if hasattr(self, "_mediaqueue_mqtt_unsub") and self._mediaqueue_mqtt_unsub:
-            self._mediaqueue_mqtt_unsub()
-            self._mediaqueue_mqtt_unsub = None
-        await self._subscribe_mediaqueue_mqtt()
+        self._setup_listeners()
+
+        # Only re-read and recompute roles whose source changed
+        changed_roles = [
+            role
+            for role, entity_id in self._entity_refs.items()
+            if entity_id != previous_refs.get(role)
+            or (role in self._mqtt_roles) != (role in previous_mqtt_roles)
+        ]
+        for role in changed_roles:
+            self._linked_states[role] = self._read_linked_state(role)
+        self._refresh_roles(changed_roles)
+        self._async_write_ha_state_if_changed()
+
+        # Re-subscribe to MQTT in case the device or ingestion mode changed
+        self._unsubscribe_mqtt()
+        await self._async_subscribe_mqtt()
 
     @property
-    def device_info(self):
+    def device_info(self) -> DeviceInfo:
         """Return device information."""
-        # Use the selected device's identifier if present, otherwise fallback to our own
-        linked_identifier = self._config_entry.data.get("linked_device_identifier")
-        if linked_identifier:
-            # linked_identifier is a tuple (domain, id)
-            return {
-                "identifiers": {tuple(linked_identifier)},
-                "name": self._attr_name or DEVICE_NAME_DEFAULT,
-                "manufacturer": DEVICE_MANUFACTURER,
-                "model": DEVICE_MODEL,
-                "sw_version": DEVICE_SW_VERSION,
-            }
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": self._attr_name or DEVICE_NAME_DEFAULT,
-            "manufacturer": DEVICE_MANUFACTURER,
-            "model": DEVICE_MODEL,
-            "sw_version": DEVICE_SW_VERSION,
-        }
+        return entry_device_info(self._config_entry, self._attr_name)
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
@@ -676,8 +1388,37 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
                 "homeassistant", SERVICE_TURN_OFF, {ATTR_ENTITY_ID: power_entity}
             )
 
+    async def _async_publish_command(self, command: str, payload: str = "") -> None:
+        """Publish a command straight to the YAN device topic."""
+        self._counters.mqtt_commands += 1
+        await mqtt.async_publish(
+            self.hass, self._command_topics[command], payload, 1, False
+        )
+
+    async def _async_send_command(
+        self,
+        command: str,
+        action_key: str,
+        template_vars: dict[str, Any] | None = None,
+    ) -> None:
+        """Send a command via MQTT when possible, else via configured actions."""
+        if self._command_topics:
+            await self._async_publish_command(command)
+        else:
+            await self._call_action_list(action_key, template_vars)
+
     async def _set_volume_entity_value(self, value: float) -> None:
         """Set volume entity value with proper service call."""
+        # Ensure value is within entity's range
+        min_val, max_val = self._get_volume_range()
+        clamped_value = max(min_val, min(max_val, value))
+
+        if self._command_topics:
+            await self._async_publish_command(
+                YAN_COMMAND_VOLUME, json.dumps({"value": clamped_value})
+            )
+            return
+
         volume_entity = self._entity_refs.get(CONF_VOLUME_ENTITY)
         if not volume_entity:
             return
@@ -685,10 +1426,6 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         domain = volume_entity.split(".", 1)[0]
         service = "set_value"
 
-        # Ensure value is within entity's range
-        min_val, max_val = self._get_volume_range()
-        clamped_value = max(min_val, min(max_val, value))
-
         try:
             await self.hass.services.async_call(
                 domain, service, {ATTR_ENTITY_ID: volume_entity, "value": clamped_value}
@@ -696,40 +1433,89 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         except Exception as ex:
             _LOGGER.error("Failed to set volume for %s: %s", volume_entity, ex)
 
+    def _volume_step(self) -> float:
+        """Return the configured volume step in the entity's range."""
+        min_val, max_val = self._get_volume_range()
+        return self._config_entry.options.get(CONF_VOLUME_STEP, DEFAULT_VOLUME_STEP) * (
+            max_val - min_val
+        )
+
+    @callback
+    def _async_queue_volume(self, value: float) -> None:
+        """Set an optimistic volume target and schedule one coalesced set_value."""
+        min_val, max_val = self._get_volume_range()
+        self._volume_target = max(min_val, min(max_val, value))
+        self._attr_volume_level = self._normalize_volume_from_entity_range(
+            self._volume_target
+        )
+        self._async_write_ha_state_if_changed()
+
+        if self._volume_flush_unsub is None:
+            self._volume_flush_unsub = async_call_later(
+                self.hass, VOLUME_COALESCE_WINDOW, self._async_flush_volume
+            )
+
+    async def _async_flush_volume(self, _now: datetime) -> None:
+        """Send the accumulated volume target to the volume entity."""
+        self._volume_flush_unsub = None
+        if self._volume_target is None:
+            return
+
+        if self._volume_reconcile_unsub:
+            self._volume_reconcile_unsub()
+        self._volume_reconcile_unsub = async_call_later(
+            self.hass, VOLUME_RECONCILE_TIMEOUT, self._async_volume_reconcile_timeout
+        )
+        await self._set_volume_entity_value(self._volume_target)
+
+    @callback
+    def _async_volume_reconcile_timeout(self, _now: datetime) -> None:
+        """Fall back to the reported volume if the target was never confirmed."""
+        self._volume_reconcile_unsub = None
+        if self._volume_flush_unsub is not None:
+            return
+
+        self._volume_target = None
+        self._refresh_volume()
+        self._async_write_ha_state_if_changed()
+
+    @callback
+    def _cancel_volume_timers(self) -> None:
+        """Cancel pending volume flush and reconcile timers."""
+        if self._volume_flush_unsub:
+            self._volume_flush_unsub()
+            self._volume_flush_unsub = None
+        if self._volume_reconcile_unsub:
+            self._volume_reconcile_unsub()
+            self._volume_reconcile_unsub = None
+
     async def async_volume_up(self) -> None:
         """Turn volume up."""
-        current_value = self._get_numeric_state_value(
-            self._entity_refs.get(CONF_VOLUME_ENTITY)
-        )
+        current_value = self._volume_target
+        if current_value is None:
+            current_value = self._get_numeric_state_value(CONF_VOLUME_ENTITY)
         if current_value is not None:
-            min_val, max_val = self._get_volume_range()
-            step = self._config_entry.options.get(CONF_VOLUME_STEP, 0.05) * (
-                max_val - min_val
-            )
-            new_value = min(max_val, current_value + step)
-            await self._set_volume_entity_value(new_value)
+            self._async_queue_volume(current_value + self._volume_step())
 
     async def async_volume_down(self) -> None:
         """Turn volume down."""
-        current_value = self._get_numeric_state_value(
-            self._entity_refs.get(CONF_VOLUME_ENTITY)
-        )
+        current_value = self._volume_target
+        if current_value is None:
+            current_value = self._get_numeric_state_value(CONF_VOLUME_ENTITY)
         if current_value is not None:
-            min_val, max_val = self._get_volume_range()
-            step = self._config_entry.options.get(CONF_VOLUME_STEP, 0.05) * (
-                max_val - min_val
-            )
-            new_value = max(min_val, current_value - step)
-            await self._set_volume_entity_value(new_value)
+            self._async_queue_volume(current_value - self._volume_step())
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        entity_value = self._normalize_volume_to_entity_range(volume)
-        await self._set_volume_entity_value(volume)
+        self._async_queue_volume(self._normalize_volume_to_entity_range(volume))
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute or unmute media player."""
-        if mute_entity := self._entity_refs.get(CONF_MUTE_ENTITY):
+        if self._command_topics:
+            await self._async_publish_command(
+                YAN_COMMAND_MUTE, YAN_MUTE_PAYLOADS[bool(mute)]
+            )
+        elif mute_entity := self._entity_refs.get(CONF_MUTE_ENTITY):
             service = SERVICE_TURN_ON if mute else SERVICE_TURN_OFF
             await self.hass.services.async_call(
                 "homeassistant", service, {ATTR_ENTITY_ID: mute_entity}
@@ -753,23 +1539,26 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
 
     async def async_media_play(self) -> None:
         """Send play command."""
-        await self._call_action_list(CONF_PLAY_ACTION)
+        self._async_set_optimistic_state(MediaPlayerState.PLAYING)
+        await self._async_send_command(YAN_COMMAND_PLAY, CONF_PLAY_ACTION)
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
-        await self._call_action_list(CONF_PAUSE_ACTION)
+        self._async_set_optimistic_state(MediaPlayerState.PAUSED)
+        await self._async_send_command(YAN_COMMAND_PAUSE, CONF_PAUSE_ACTION)
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
-        await self._call_action_list(CONF_STOP_ACTION)
+        self._async_set_optimistic_state(MediaPlayerState.IDLE)
+        await self._async_send_command(YAN_COMMAND_STOP, CONF_STOP_ACTION)
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
-        await self._call_action_list(CONF_NEXT_ACTION)
+        await self._async_send_command(YAN_COMMAND_NEXT, CONF_NEXT_ACTION)
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
-        await self._call_action_list(CONF_PREVIOUS_ACTION)
+        await self._async_send_command(YAN_COMMAND_PREVIOUS, CONF_PREVIOUS_ACTION)
 
     async def async_toggle(self) -> None:
         """Toggle the media player."""
@@ -795,22 +1584,65 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
                 await self.async_media_play()
 
     async def async_media_seek(self, position: float) -> None:
-        """Send seek command."""
-        seek_actions = self._actions.get(CONF_SEEK_ACTION)
-        if not seek_actions:
+        """Send seek command, dropping positions superseded while one is in flight."""
+        if not self._command_topics and not self._action_plans.get(CONF_SEEK_ACTION):
             return
 
+        # Show the new position at once so the UI does not bounce back
+        self._seek_position = position
+        self._attr_media_position = position
+        self._attr_media_position_updated_at = util.dt.utcnow()
+        self._async_write_ha_state_if_changed()
+
+        # Latest wins: an in-flight seek picks this target up when it finishes
+        self._seek_target = position
+        if self._seek_in_flight:
+            return
+
+        self._seek_in_flight = True
+        try:
+            while self._seek_target is not None:
+                target, self._seek_target = self._seek_target, None
+                # Give the device time to apply the seek and report it back,
+                # armed first so the position never stays held if this fails
+                self._cancel_seek_reconcile()
+                self._seek_reconcile_unsub = async_call_later(
+                    self.hass, SEEK_RECONCILE_TIMEOUT, self._async_seek_reconcile_timeout
+                )
+                await self._async_send_seek(target)
+        except Exception:
+            # The seek never reached the device, show the reported position
+            self._seek_target = None
+            self._seek_position = None
+            self._cancel_seek_reconcile()
+            self._anchor_media_position()
+            self._async_write_ha_state_if_changed()
+            raise
+        finally:
+            self._seek_in_flight = False
+
+    async def _async_send_seek(self, position: float) -> None:
+        """Publish the seek command or call the seek actions for a position."""
         # Calculate position as percentage if duration is available
         seek_position = position
+        unit = "seconds"
         if self._attr_media_duration and self._attr_media_duration > 0:
             seek_position = (position / self._attr_media_duration) * 100
+            unit = "percent"
+
+        if self._command_topics:
+            # The unit tells the device how to read the value
+            await self._async_publish_command(
+                YAN_COMMAND_SEEK, json.dumps({"value": seek_position, "unit": unit})
+            )
+            return
 
         template_vars = {
             "position": position,
             "seek_position": seek_position,
             "position_pct": seek_position,
         }
-        await self._call_action_list(CONF_SEEK_ACTION, template_vars)
+        await self._call_action_list(CONF_SEEK_ACTION, template_vars, blocking=True)
 
     @property
     def media_position(self) -> int | None:
@@ -840,16 +1672,19 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         **kwargs: Any,
     ) -> None:
         """Play a piece of media using templated actions."""
-
-        print(f"DEBUG: async_play_media called with media_type={media_type}, media_id={media_id}, enqueue={enqueue}, announce={announce}, kwargs={kwargs}")
+        _LOGGER.debug(
+            "async_play_media: media_type=%s media_id=%s enqueue=%s announce=%s kwargs=%s",
+            media_type,
+            media_id,
+            enqueue,
+            announce,
+            kwargs,
+        )
         # Handle playlist selection
         if media_id and media_id.startswith("playlist:"):
             playlist_index = media_id.split(":", 1)[1]
-            playlist_name = None
-            for playlist in self._playlists:
-                if str(playlist.get("index")) == str(playlist_index):
-                    playlist_name = playlist.get("title")
-                    break
+            playlist = self._playlists.get_by_index(playlist_index)
+            playlist_name = playlist.get("title") if playlist else None
             if playlist_name:
                 topic = f"yan/{self._device_id}/command/media_load_playlist"
                 payload = json.dumps({"playlist": playlist_name})
@@ -862,13 +1697,16 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         # Handle source selection
         if media_id and media_id.startswith("source:"):
             source = media_id.split(":", 1)[1]
-            if source:
-                    topic = f"yan/{self._device_id}/command/media_play_from_queue"
-                    payload = json.dumps({"title": source})
-                    _LOGGER.debug("async_play_media: Publishing playlist load: topic=%s payload=%s", topic, payload)
-                    await mqtt.async_publish(self.hass, topic, payload, 1, False)
+            item = self._mediaqueue.resolve(source)
+            if item:
+                topic = f"yan/{self._device_id}/command/media_play_from_queue"
+                payload = json.dumps(
+                    {"title": item.get("title"), "mediaId": item.get("mediaId")}
+                )
+                _LOGGER.debug("async_play_media: Publishing play from queue: topic=%s payload=%s", topic, payload)
+                await mqtt.async_publish(self.hass, topic, payload, 1, False)
             else:
-                _LOGGER.warning("async_play_media: Playlist with index %s not found", playlist_index)
+                _LOGGER.warning("async_play_media: Queue item %s not found", source)
             return
 
         # Handle Home Assistant media sources
@@ -917,66 +1755,39 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         await self._call_action_list(CONF_REPEAT_SET_ACTION, template_vars)
 
     async def _call_action_list(
-        self, action_key: str, template_vars: dict[str, Any] | None = None
+        self,
+        action_key: str,
+        template_vars: dict[str, Any] | None = None,
+        blocking: bool = False,
     ) -> None:
         """Call all actions configured for the given action key."""
-        actions_list = self._actions.get(action_key)
-        if not actions_list:
+        plans = self._action_plans.get(action_key)
+        if not plans:
             _LOGGER.debug("No actions configured for %s", action_key)
             return
 
-        if not isinstance(actions_list, list):
-            _LOGGER.warning(
-                "Actions for %s are not a list: %s", action_key, actions_list
-            )
-            return
-
-        if template_vars is None:
-            template_vars = {}
-
-        def has_template(value: Any) -> bool:
-            """Check if a value contains a template."""
-            if isinstance(value, str):
-                return "{{" in value or "{%" in value
-            return False
-
-        for action_config in actions_list:
-            if not isinstance(action_config, dict):
-                _LOGGER.warning(
-                    "Skipping invalid action config (not a dict): %s", action_config
-                )
-                continue
-
+        variables = template_vars or {}
+        for plan in plans:
             try:
-                # Create a deep copy to avoid modifying the original config
-                config_copy = deepcopy(action_config)
-
-                # Check if we have data with a value that might need templating
-                if "data" in config_copy and isinstance(config_copy["data"], dict):
-                    data_dict = config_copy["data"]
-
-                    # Check each value in data for templates
-                    for key, value in list(data_dict.items()):
-                        if has_template(value):
-                            data_dict[key] = Template(value, self.hass)
-
-                # Use Home Assistant's service calling helper with the copied config
-                await async_call_from_config(
-                    self.hass,
-                    config_copy,
-                    variables=template_vars,
-                    blocking=False,
-                    validate_config=False,
+                domain, service, data, target = plan.render(variables)
+                self._counters.actions += 1
+                await self.hass.services.async_call(
+                    domain, service, data, blocking=blocking, target=target
                 )
 
                 _LOGGER.debug(
-                    "Called action %s with config: %s", action_key, config_copy
+                    "Called action %s: %s.%s data=%s target=%s",
+                    action_key,
+                    domain,
+                    service,
+                    data,
+                    target,
                 )
             except Exception as ex:
                 _LOGGER.error(
                     "Error calling action %s with config %s: %s",
                     action_key,
-                    action_config,
+                    dict(plan.config),
                     ex,
                 )
 
@@ -1004,30 +1815,95 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
     def _has_active_media(self) -> bool:
         """Check if we have active media info indicating playback."""
         # Check for meaningful media title or artist
-        if self._get_entity_state_value(self._entity_refs.get(CONF_MEDIA_TITLE_ENTITY)):
+        if self._get_entity_state_value(CONF_MEDIA_TITLE_ENTITY):
             return True
-        if self._get_entity_state_value(
-            self._entity_refs.get(CONF_MEDIA_ARTIST_ENTITY)
-        ):
+        if self._get_entity_state_value(CONF_MEDIA_ARTIST_ENTITY):
             return True
 
         # Check if position is greater than 0 (indicates active playback)
-        position = self._get_numeric_state_value(
-            self._entity_refs.get(CONF_MEDIA_POSITION_ENTITY)
-        )
+        position = self._get_numeric_state_value(CONF_MEDIA_POSITION_ENTITY)
         return position is not None and position > 0
 
+    @callback
+    def _invalidate_browse_nodes(self, root_id: str) -> None:
+        """Drop the memoized nodes of a directory and all of its pages."""
+        for node_id in [
+            node_id
+            for node_id in self._browse_nodes
+            if root_node_id(node_id) == root_id
+        ]:
+            del self._browse_nodes[node_id]
+
+    def _get_browse_node(self, node_id: str) -> BrowseMedia:
+        """Return a memoized browse node, building only the requested page."""
+        if self._browse_token != self.access_token:
+            self._browse_nodes.clear()
+            self._browse_token = self.access_token
+
+        if (node := self._browse_nodes.get(node_id)) is None:
+            root_id, page = parse_node_id(node_id)
+            if root_id == SOURCES_NODE_ID:
+                node = build_sources_node(
+                    self._mediaqueue, self.get_browse_image_url, page
+                )
+            else:
+                node = build_playlists_node(
+                    self._playlists.playlists, self.get_browse_image_url, page
+                )
+            self._browse_nodes[node_id] = node
+        return node
+
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Serve the now playing image from the shared artwork cache."""
+        url = self.media_image_url
+        if not url or not url.startswith(("http://", "https://")):
+            # Images served by Home Assistant itself, e.g. an image entity
+            return await super().async_get_media_image()
+
+        hub: CCPlayerHub = self.hass.data[DOMAIN]
+        return await hub.artwork.async_get(url)
+
+    async def async_get_browse_image(
+        self,
+        media_content_type: str,
+        media_content_id: str,
+        media_image_id: str | None = None,
+    ) -> tuple[bytes | None, str | None]:
+        """Serve a queue or playlist thumbnail from the shared artwork cache."""
+        kind, _, key = media_content_id.partition(":")
+        if kind == "source":
+            item = self._mediaqueue.resolve(key)
+        elif kind == "playlist":
+            item = self._playlists.get_by_index(key)
+        else:
+            item = None
+
+        url = resolve_thumbnail_url(self.hass, item.get("thumbnail") if item else None)
+        if not url:
+            return None, None
+
+        # Browse items request a downscaled size through media_image_id
+        size = None
+        if media_image_id and media_image_id.isdigit():
+            size = int(media_image_id)
+        hub: CCPlayerHub = self.hass.data[DOMAIN]
+        return await hub.artwork.async_get(url, size)
+
+    async def _async_request_queue(self) -> None:
+        """Ask the device to publish a full media queue snapshot."""
+        topic = f"yan/{self._device_id}/command/media_get_queue"
+        await mqtt.async_publish(self.hass, topic, "", 1, False)
+
+    async def _async_request_playlists(self) -> None:
+        """Ask the device to publish its playlists."""
+        topic = f"yan/{self._device_id}/command/media_get_playlists"
+        await mqtt.async_publish(self.hass, topic, "", 1, False)
+
     async def async_browse_media(
         self, media_content_type: str | None = None, media_content_id: str | None = None
     ) -> BrowseMedia:
-   
-
-        if(self._playlists.count == 0):
-            topic = f"yan/{self._device_id}/command/media_get_playlists"
-            await mqtt.async_publish(self.hass, topic, "", 1, False)
-
-        _LOGGER.debug("Browsing media: type=%s, id=%s, playlists=%s", media_content_type, media_content_id, self._playlists)
-        print(f"DEBUG: Browsing media: type={media_content_type}, id={media_content_id}, playlists={self._playlists}")
+        """Implement the media browser."""
+        _LOGGER.debug("Browsing media: type=%s, id=%s", media_content_type, media_content_id)
 
         # Root: show three directories: Media Sources, Sources, Playlists
         if not media_content_id or media_content_id == "media_player":
@@ -1044,7 +1920,7 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
                 BrowseMedia(
                     title="Sources",
                     media_class=MediaClass.DIRECTORY,
-                    media_content_id="ccplayer_sources",
+                    media_content_id=SOURCES_NODE_ID,
                     media_content_type=MediaType.VIDEO,
                     can_play=False,
                     can_expand=True,
@@ -1053,7 +1929,7 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
                 BrowseMedia(
                     title="Playlists",
                     media_class="directory",
-                    media_content_id="ccplayer_playlists",
+                    media_content_id=PLAYLISTS_NODE_ID,
                     media_content_type="directory",
                     can_play=False,
                     can_expand=True,
@@ -1074,98 +1950,19 @@ class CCPlayerMediaPlayer(MediaPlayerEntity):
         if media_content_id == "ha_media_source":
             return await media_source.async_browse_media(self.hass, None)
 
-        # Expand your custom sources
-        if media_content_id == "ccplayer_sources":
-            children = []
-            # Use _mediaqueue instead of _attr_source_list
-            for item in self._mediaqueue:
-                title = item.get("title", f"Item {item.get('index', '')}")
-                media_id = item.get("mediaId")
-                thumbnail = item.get("thumbnail")
-
-                print(
-                    f"DEBUG: Processing mediaqueue item: title={title}, media_id={media_id}, thumbnail={thumbnail}"
-                )
+        root_id = root_node_id(media_content_id)
 
-                # Ensure thumbnail URL is properly formatted
-                if thumbnail and not thumbnail.startswith(("http://", "https://")):
-                    if thumbnail.startswith("/"):
-                        # Make relative URLs absolute
-                        base_url = (
-                            self.hass.config.external_url
-                            or self.hass.config.internal_url
-                            or "http://localhost:8123"
-                        )
-                        thumbnail = f"{base_url}{thumbnail}"
-                    else:
-                        # If it doesn't start with / or http, prepend http://
-                        thumbnail = f"http://{thumbnail}"
-
-                if thumbnail:
-                    print(f"DEBUG: Using thumbnail for {title}: {thumbnail}")
-
-                # Create BrowseMedia object with proper thumbnail
-                browse_item = BrowseMedia(
-                    title=title,
-                    media_class=MediaClass.VIDEO,
-                    media_content_id=f"source:{title}",
-                    media_content_type=MediaType.VIDEO,
-                    can_play=True,
-                    can_expand=False,
-                    thumbnail=thumbnail,
-                    children=[],
-                )
+        # Expand your custom sources, or one page of them
+        if root_id == SOURCES_NODE_ID:
+            return self._get_browse_node(media_content_id)
 
-                children.append(browse_item)
-
-            _LOGGER.debug("Created %d media items for ccplayer_sources", len(children))
-            print(f"DEBUG: Created {len(children)} media items for ccplayer_sources")
-
-            return BrowseMedia(
-                title="Sources",
-                media_class="directory",
-                media_content_id="ccplayer_sources",
-                media_content_type="directory",
-                can_play=False,
-                can_expand=True,
-                children=children,
-            )
-
-        # Expand your playlists
-        if media_content_id == "ccplayer_playlists":
-            children = []
-            for playlist in self._playlists:
-                name = playlist.get("title") or playlist.get("name") or ""
-                # Remove trailing .json if present
-                if name.endswith(".json"):
-                    name = name[:-5]
-                # Append description if available
-                description = playlist.get("description")
-                if description:
-                    name = f"{name} ({description})"
-                index = playlist.get("index")
-                thumbnail = playlist.get("thumbnail", None)
-                children.append(
-                    BrowseMedia(
-                        title=name,
-                        media_class="playlist",
-                        media_content_id=f"playlist:{index}",
-                        media_content_type="playlist",
-                        can_play=True,
-                        can_expand=False,
-                        thumbnail=thumbnail,
-                        children=[],
-                    )
-                )
-            return BrowseMedia(
-                title="Playlists",
-                media_class="directory",
-                media_content_id="ccplayer_playlists",
-                media_content_type="directory",
-                can_play=False,
-                can_expand=True,
-                children=children,
-            )
+        # Expand your playlists, or one page of them
+        if root_id == PLAYLISTS_NODE_ID:
+            # Cold or stale cache: ask the device and wait briefly for the reply.
+            # Without a device id there is nobody to ask.
+            if self._device_id:
+                await self._playlists.async_get(self._async_request_playlists)
+            return self._get_browse_node(media_content_id)
 
         # Otherwise, fallback to media_source (for subfolders etc)
         return await media_source.async_browse_media(self.hass, media_content_id)
@@ -0,0 +1,103 @@
+"""Indexed media queue for CC Player."""
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import voluptuous as vol
+
+from .payloads import QUEUE_ITEM_SCHEMA
+
+
+class MediaQueue:
+    """Media queue items with lookups by mediaId and title.
+
+    Built once per media_queue payload, so resolving a source: media id does
+    not scan the queue.
+    """
+
+    __slots__ = ("items", "by_media_id", "by_title")
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        """Index the queue items."""
+        self.items: tuple[dict[str, Any], ...] = tuple(
+            item for item in items if isinstance(item, dict)
+        )
+        self.by_media_id: dict[str, dict[str, Any]] = {}
+        # Titles are not unique, so each title keeps every matching item
+        self.by_title: dict[str, list[dict[str, Any]]] = {}
+
+        for item in self.items:
+            if (media_id := item.get("mediaId")) is not None:
+                self.by_media_id.setdefault(str(media_id), item)
+            if title := item.get("title"):
+                self.by_title.setdefault(title, []).append(item)
+
+    def __len__(self) -> int:
+        """Return the number of items in the queue."""
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the items in queue order."""
+        return iter(self.items)
+
+    @staticmethod
+    def source_key(item: dict[str, Any]) -> str:
+        """Return the key used in source: media ids for an item."""
+        if (media_id := item.get("mediaId")) is not None:
+            return str(media_id)
+        return item.get("title") or ""
+
+    def apply_delta(self, ops: Iterable[Any]) -> "MediaQueue":
+        """Return a new queue with delta operations applied in order.
+
+        Operations address items by mediaId:
+        {"op": "insert", "item": {...}, "position": 3} (appends without position)
+        {"op": "remove", "mediaId": "..."}
+        {"op": "move", "mediaId": "...", "position": 0}
+        {"op": "update", "mediaId": "...", "item": {...}} (merged into the item)
+
+        Raises ValueError if an operation is malformed or addresses an item
+        that is not in the queue, meaning the queue is out of sync.
+        """
+        items = list(self.items)
+
+        def valid_item(item: Any) -> dict[str, Any]:
+            try:
+                return QUEUE_ITEM_SCHEMA(item)
+            except vol.Invalid as ex:
+                raise ValueError(f"Invalid queue item {item}: {ex}") from ex
+
+        def position_of(media_id: Any) -> int:
+            for position, item in enumerate(items):
+                if str(item.get("mediaId")) == str(media_id):
+                    return position
+            raise ValueError(f"mediaId {media_id} is not in the queue")
+
+        for op in ops:
+            if not isinstance(op, dict):
+                raise ValueError(f"Invalid queue operation: {op}")
+            kind = op.get("op")
+            if kind == "insert":
+                items.insert(op.get("position", len(items)), valid_item(op.get("item")))
+            elif kind == "remove":
+                del items[position_of(op.get("mediaId"))]
+            elif kind == "move":
+                item = items.pop(position_of(op.get("mediaId")))
+                items.insert(op.get("position", len(items)), item)
+            elif kind == "update":
+                if not isinstance(changes := op.get("item"), dict):
+                    raise ValueError(f"Invalid queue update: {op}")
+                position = position_of(op.get("mediaId"))
+                items[position] = valid_item({**items[position], **changes})
+            else:
+                raise ValueError(f"Unknown queue operation: {kind}")
+
+        return MediaQueue(items)
+
+    def resolve(self, key: str) -> dict[str, Any] | None:
+        """Return the item for a source: key, accepting legacy title keys."""
+        if (item := self.by_media_id.get(key)) is not None:
+            return item
+        if items := self.by_title.get(key):
+            return items[0]
+        return None
@@ -11,6 +11,8 @@ from homeassistant.helpers import selector
 from .const import (
     CONF_ACTIONS,
     CONF_CLEAR_PLAYLIST_ACTION,
+    CONF_DIRECT_MQTT_COMMANDS,
+    CONF_MAX_PAYLOAD_SIZE,
     CONF_MEDIA_ALBUM_ENTITY,
     CONF_MEDIA_ARTIST_ENTITY,
     CONF_MEDIA_DURATION_ENTITY,
@@ -19,11 +21,15 @@ from .const import (
     CONF_MEDIA_TITLE_ENTITY,
     CONF_MUTE_ENTITY,
     CONF_NEXT_ACTION,
+    CONF_OPTIMISTIC_TRANSPORT,
+    CONF_OPTIMISTIC_WINDOW,
     CONF_PAUSE_ACTION,
     CONF_PLAY_ACTION,
     CONF_PLAY_MEDIA_ACTION,
     CONF_PLAY_PAUSE_ACTION,
     CONF_PLAYER_STATE_ENTITY,
+    CONF_POSITION_DRIFT_TOLERANCE,
+    CONF_POSITION_EXTRAPOLATION,
     CONF_POWER_ENTITY,
     CONF_PREVIOUS_ACTION,
     CONF_REPEAT_SET_ACTION,
@@ -31,10 +37,18 @@ from .const import (
     CONF_SHUFFLE_SET_ACTION,
     CONF_SOURCE_ENTITY,
     CONF_SOURCE_LIST_ENTITY,
+    CONF_STATE_FROM_MQTT,
     CONF_STOP_ACTION,
     CONF_TOGGLE_ACTION,
     CONF_VOLUME_ENTITY,
     CONF_VOLUME_STEP,
+    DEFAULT_DIRECT_MQTT_COMMANDS,
+    DEFAULT_MAX_PAYLOAD_SIZE,
+    DEFAULT_OPTIMISTIC_TRANSPORT,
+    DEFAULT_OPTIMISTIC_WINDOW,
+    DEFAULT_POSITION_DRIFT_TOLERANCE,
+    DEFAULT_POSITION_EXTRAPOLATION,
+    DEFAULT_STATE_FROM_MQTT,
     DEFAULT_VOLUME_STEP,
     # New constants
     CONF_MEDIA_ALBUM_ARTIST_ENTITY,
@@ -158,6 +172,60 @@ class CCPlayerOptionsFlow(OptionsFlow):
                 default=self.options.get(CONF_VOLUME_STEP, DEFAULT_VOLUME_STEP),
             )
         ] = vol.Coerce(float)
+        schema_fields[
+            vol.Optional(
+                CONF_POSITION_EXTRAPOLATION,
+                default=self.options.get(
+                    CONF_POSITION_EXTRAPOLATION, DEFAULT_POSITION_EXTRAPOLATION
+                ),
+            )
+        ] = bool
+        schema_fields[
+            vol.Optional(
+                CONF_POSITION_DRIFT_TOLERANCE,
+                default=self.options.get(
+                    CONF_POSITION_DRIFT_TOLERANCE, DEFAULT_POSITION_DRIFT_TOLERANCE
+                ),
+            )
+        ] = vol.All(vol.Coerce(float), vol.Range(min=0))
+        schema_fields[
+            vol.Optional(
+                CONF_OPTIMISTIC_TRANSPORT,
+                default=self.options.get(
+                    CONF_OPTIMISTIC_TRANSPORT, DEFAULT_OPTIMISTIC_TRANSPORT
+                ),
+            )
+        ] = bool
+        schema_fields[
+            vol.Optional(
+                CONF_OPTIMISTIC_WINDOW,
+                default=self.options.get(
+                    CONF_OPTIMISTIC_WINDOW, DEFAULT_OPTIMISTIC_WINDOW
+                ),
+            )
+        ] = vol.All(vol.Coerce(float), vol.Range(min=0))
+        schema_fields[
+            vol.Optional(
+                CONF_DIRECT_MQTT_COMMANDS,
+                default=self.options.get(
+                    CONF_DIRECT_MQTT_COMMANDS, DEFAULT_DIRECT_MQTT_COMMANDS
+                ),
+            )
+        ] = bool
+        schema_fields[
+            vol.Optional(
+                CONF_STATE_FROM_MQTT,
+                default=self.options.get(CONF_STATE_FROM_MQTT, DEFAULT_STATE_FROM_MQTT),
+            )
+        ] = bool
+        schema_fields[
+            vol.Optional(
+                CONF_MAX_PAYLOAD_SIZE,
+                default=self.options.get(
+                    CONF_MAX_PAYLOAD_SIZE, DEFAULT_MAX_PAYLOAD_SIZE
+                ),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=1))
         return vol.Schema(schema_fields)
 
     def _get_media_info_options_schema(self) -> vol.Schema:
@@ -254,8 +322,18 @@ class CCPlayerOptionsFlow(OptionsFlow):
                         self.options[key] = value.strip()
                     else:
                         self.options.pop(key, None)
-            if CONF_VOLUME_STEP in user_input:
-                self.options[CONF_VOLUME_STEP] = user_input[CONF_VOLUME_STEP]
+            for key in (
+                CONF_VOLUME_STEP,
+                CONF_POSITION_EXTRAPOLATION,
+                CONF_POSITION_DRIFT_TOLERANCE,
+                CONF_OPTIMISTIC_TRANSPORT,
+                CONF_OPTIMISTIC_WINDOW,
+                CONF_DIRECT_MQTT_COMMANDS,
+                CONF_STATE_FROM_MQTT,
+                CONF_MAX_PAYLOAD_SIZE,
+            ):
+                if key in user_input:
+                    self.options[key] = user_input[key]
             # Proceed to the next step: media_info
             return await self.async_step_media_info()
 
@@ -0,0 +1,65 @@
+"""Validation of the JSON payloads published by YAN devices."""
+
+from collections.abc import Iterable
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.helpers import config_validation as cv
+
+_LOGGER = logging.getLogger(__name__)
+
+# Payloads at least this large are decoded in the executor, not in the loop
+DECODE_EXECUTOR_THRESHOLD = 64 * 1024
+
+_OPTIONAL_STRING = vol.Any(None, str)
+
+# Only the keys the integration reads are checked, the rest is kept as is
+QUEUE_ITEM_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("mediaId"): vol.Any(str, int),
+            vol.Optional("title"): _OPTIONAL_STRING,
+            vol.Optional("index"): vol.Any(str, int),
+            vol.Optional("thumbnail"): _OPTIONAL_STRING,
+        },
+        extra=vol.ALLOW_EXTRA,
+    ),
+    cv.has_at_least_one_key("mediaId", "title"),
+)
+
+PLAYLIST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required("index"): vol.Any(str, int),
+            vol.Optional("title"): _OPTIONAL_STRING,
+            vol.Optional("name"): _OPTIONAL_STRING,
+            vol.Optional("description"): _OPTIONAL_STRING,
+            vol.Optional("thumbnail"): _OPTIONAL_STRING,
+        },
+        extra=vol.ALLOW_EXTRA,
+    ),
+    cv.has_at_least_one_key("title", "name"),
+)
+
+
+def valid_entries(
+    schema: vol.Schema, entries: Any, kind: str
+) -> list[dict[str, Any]]:
+    """Return the entries matching the schema, logging how many were dropped."""
+    if not isinstance(entries, Iterable) or isinstance(entries, (str, dict)):
+        _LOGGER.warning("Ignoring %s payload that is not a list", kind)
+        return []
+
+    valid = []
+    dropped = 0
+    for entry in entries:
+        try:
+            valid.append(schema(entry))
+        except vol.Invalid:
+            dropped += 1
+
+    if dropped:
+        _LOGGER.warning("Dropped %d malformed %s entries", dropped, kind)
+    return valid
@@ -0,0 +1,91 @@
+"""Per-player performance counters for CC Player."""
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds of the refresh duration histogram buckets, in milliseconds
+REFRESH_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0)
+
+
+class DurationHistogram:
+    """Durations counted into fixed buckets, plus an overflow bucket."""
+
+    def __init__(self, bounds: tuple[float, ...] = REFRESH_BUCKETS_MS) -> None:
+        """Initialize an empty histogram."""
+        self._bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Count one duration."""
+        duration_ms = seconds * 1000
+        self.counts[bisect_left(self._bounds, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    @property
+    def mean_ms(self) -> float | None:
+        """Return the mean duration, None before the first one."""
+        return self.total_ms / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the buckets keyed by upper bound, for attributes and diagnostics."""
+        buckets = {
+            f"le_{bound:g}ms": count for bound, count in zip(self._bounds, self.counts)
+        }
+        buckets[f"gt_{self._bounds[-1]:g}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean_ms, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class PlayerCounters:
+    """Work done by one player since it was set up.
+
+    Plain attribute increments on the hot paths; the diagnostic sensors
+    read them on their poll interval, so counting never writes state.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters at zero."""
+        self.state_changes = 0
+        self.refreshes = 0
+        self.state_writes = 0
+        self.state_writes_suppressed = 0
+        self.mqtt_messages = 0
+        self.mqtt_bytes = 0
+        self.actions = 0
+        self.mqtt_commands = 0
+        # Full re-reads of every linked entity, and refreshes of changed roles
+        self.full_refresh_durations = DurationHistogram()
+        self.role_refresh_durations = DurationHistogram()
+
+    def record_refresh(self, seconds: float, full: bool = False) -> None:
+        """Count a refresh and its duration."""
+        self.refreshes += 1
+        if full:
+            self.full_refresh_durations.record(seconds)
+        else:
+            self.role_refresh_durations.record(seconds)
+
+    def diagnostics_data(self) -> dict[str, Any]:
+        """Return the counters for the diagnostics download."""
+        return {
+            "state_changes": self.state_changes,
+            "refreshes": self.refreshes,
+            "state_writes": self.state_writes,
+            "state_writes_suppressed": self.state_writes_suppressed,
+            "mqtt_messages": self.mqtt_messages,
+            "mqtt_bytes": self.mqtt_bytes,
+            "actions": self.actions,
+            "mqtt_commands": self.mqtt_commands,
+            "full_refresh_durations": self.full_refresh_durations.as_dict(),
+            "role_refresh_durations": self.role_refresh_durations.as_dict(),
+        }
@@ -0,0 +1,128 @@
+"""Playlist cache for CC Player."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant import util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Playlists older than this are re-requested from the device on browse
+PLAYLIST_CACHE_TTL = 300.0
+# How long a browse waits for the device to answer a playlist request
+PLAYLIST_FETCH_TIMEOUT = 5.0
+# After an unanswered request, browses serve the cache without waiting this long
+PLAYLIST_FETCH_BACKOFF = 60.0
+
+
+class PlaylistCache:
+    """Playlists reported by a device, with freshness metadata.
+
+    A browse on a cold or stale cache requests the playlists and waits a
+    bounded time for the reply; concurrent browses share the same request.
+    When a request goes unanswered, e.g. the device is offline, browses
+    serve what is cached without asking again until the back-off ends.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ttl: float = PLAYLIST_CACHE_TTL,
+        fetch_timeout: float = PLAYLIST_FETCH_TIMEOUT,
+        fetch_backoff: float = PLAYLIST_FETCH_BACKOFF,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.hass = hass
+        self.playlists: list[dict[str, Any]] = []
+        self.updated_at: datetime | None = None
+        self._ttl = ttl
+        self._fetch_timeout = fetch_timeout
+        self._fetch_backoff = fetch_backoff
+        self._backoff_until: float | None = None
+        self._updated_monotonic: float | None = None
+        self._pending: asyncio.Future[None] | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Return True if the playlists were received within the TTL."""
+        return (
+            self._updated_monotonic is not None
+            and self.hass.loop.time() - self._updated_monotonic < self._ttl
+        )
+
+    @callback
+    def async_set(self, playlists: list[dict[str, Any]]) -> None:
+        """Store playlists received from the device and wake up waiters."""
+        self.playlists = playlists
+        self.updated_at = util.dt.utcnow()
+        self._updated_monotonic = self.hass.loop.time()
+        self._backoff_until = None
+
+        if self._pending is not None:
+            if not self._pending.done():
+                self._pending.set_result(None)
+            self._pending = None
+
+    @property
+    def backing_off(self) -> bool:
+        """Return True while browses should not wait for the device."""
+        return (
+            self._backoff_until is not None
+            and self.hass.loop.time() < self._backoff_until
+        )
+
+    def _start_backoff(self) -> None:
+        """Stop waiting for the device for a while after a failed request."""
+        self._backoff_until = self.hass.loop.time() + self._fetch_backoff
+
+    def get_by_index(self, index: str) -> dict[str, Any] | None:
+        """Return the playlist with the given index."""
+        for playlist in self.playlists:
+            if str(playlist.get("index")) == index:
+                return playlist
+        return None
+
+    async def async_get(
+        self, request: Callable[[], Awaitable[None]]
+    ) -> list[dict[str, Any]]:
+        """Return the playlists, requesting them first if the cache is stale."""
+        if self.is_fresh or self.backing_off:
+            return self.playlists
+
+        pending = self._pending
+        if pending is None:
+            pending = self._pending = self.hass.loop.create_future()
+            try:
+                await request()
+            except Exception as ex:
+                _LOGGER.error("Failed to request playlists: %s", ex)
+                self._pending = None
+                self._start_backoff()
+                return self.playlists
+
+        try:
+            await asyncio.wait_for(asyncio.shield(pending), self._fetch_timeout)
+        except TimeoutError:
+            _LOGGER.debug(
+                "No playlists reply within %ss, serving cached", self._fetch_timeout
+            )
+            # Let a browse after the back-off send a fresh request
+            if self._pending is pending:
+                self._pending = None
+                self._start_backoff()
+
+        return self.playlists
+
+    def diagnostics_data(self) -> dict[str, Any]:
+        """Return cache state for the diagnostics download."""
+        return {
+            "count": len(self.playlists),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "fresh": self.is_fresh,
+            "fetch_pending": self._pending is not None,
+            "backing_off": self.backing_off,
+        }
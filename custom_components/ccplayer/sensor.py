@@ -0,0 +1,146 @@
+"""Diagnostic sensors exposing the performance counters of a CC Player."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    CONF_NAME,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+
+from .const import DEFAULT_NAME, DOMAIN
+from .hub import CCPlayerHub
+from .media_player import entry_device_info
+from .perf import DurationHistogram, PlayerCounters
+
+# Counters are read on this interval instead of writing state per increment
+SCAN_INTERVAL = timedelta(seconds=30)
+PARALLEL_UPDATES = 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class CCPlayerSensorEntityDescription(SensorEntityDescription):
+    """Describes a CC Player counter sensor."""
+
+    value_fn: Callable[[PlayerCounters], StateType]
+    attributes_fn: Callable[[PlayerCounters], dict[str, Any]] | None = None
+
+
+def _mean_ms(histogram: DurationHistogram) -> float | None:
+    """Return the mean duration rounded for display."""
+    mean_ms = histogram.mean_ms
+    return round(mean_ms, 3) if mean_ms is not None else None
+
+
+def _counter(key: str, name: str) -> CCPlayerSensorEntityDescription:
+    """Describe a sensor showing one ever increasing counter."""
+    return CCPlayerSensorEntityDescription(
+        key=key,
+        name=name,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters: getattr(counters, key),
+    )
+
+
+SENSOR_DESCRIPTIONS: tuple[CCPlayerSensorEntityDescription, ...] = (
+    _counter("state_changes", "State changes received"),
+    _counter("refreshes", "Refreshes"),
+    _counter("state_writes", "State writes"),
+    _counter("state_writes_suppressed", "State writes suppressed"),
+    _counter("mqtt_messages", "MQTT messages parsed"),
+    CCPlayerSensorEntityDescription(
+        key="mqtt_bytes",
+        name="MQTT bytes parsed",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters: counters.mqtt_bytes,
+    ),
+    _counter("actions", "Actions dispatched"),
+    _counter("mqtt_commands", "MQTT commands published"),
+    CCPlayerSensorEntityDescription(
+        key="full_refresh_duration",
+        name="Full refresh duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda counters: _mean_ms(counters.full_refresh_durations),
+        attributes_fn=lambda counters: counters.full_refresh_durations.as_dict(),
+    ),
+    CCPlayerSensorEntityDescription(
+        key="role_refresh_duration",
+        name="Refresh duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda counters: _mean_ms(counters.role_refresh_durations),
+        attributes_fn=lambda counters: counters.role_refresh_durations.as_dict(),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the CC Player diagnostic sensors from a config entry."""
+    hub: CCPlayerHub = hass.data[DOMAIN]
+    counters = hub.counters_for(config_entry.entry_id)
+    async_add_entities(
+        CCPlayerCounterSensor(config_entry, counters, description)
+        for description in SENSOR_DESCRIPTIONS
+    )
+
+
+class CCPlayerCounterSensor(SensorEntity):
+    """A performance counter of a player, on the player's device."""
+
+    entity_description: CCPlayerSensorEntityDescription
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = True
+    # Histograms change on every poll, keep them out of the recorder
+    _unrecorded_attributes = frozenset({"count", "mean_ms", "max_ms", "buckets"})
+
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        counters: PlayerCounters,
+        description: CCPlayerSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._counters = counters
+        self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
+        self._attr_device_info = entry_device_info(
+            config_entry, config_entry.data.get(CONF_NAME, DEFAULT_NAME)
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the current value of the counter."""
+        return self.entity_description.value_fn(self._counters)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the duration histogram, if this sensor has one."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self._counters)